@@ -0,0 +1,89 @@
+"""On-disk cache of canonical ISBN votes for title queries.
+
+Phase 1 of a title search (search results from every store plus the ISBN
+vote) only exists to find the canonical ISBN and the product page that each
+store lists for it. Remembering both per query and store selection lets
+repeat searches go straight to fetching product details.
+"""
+
+import json
+import re
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+
+CACHE_DIR = Path.home() / ".cache" / "bookscout"
+CACHE_FILE = CACHE_DIR / "isbn-cache.sqlite3"
+DEFAULT_TTL = 7 * 24 * 60 * 60  # One week
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query so trivially different spellings share a cache entry."""
+    return " ".join(_WORD_RE.findall(query.lower()))
+
+
+def _cache_key(query: str, stores: list[str]) -> str:
+    """Build the cache key for a query searched in the given stores.
+
+    A vote taken over some stores can differ from one over all of them, so
+    the store selection is part of the key.
+    """
+    return normalize_query(query) + "\t" + ",".join(sorted(stores))
+
+
+def _connect() -> sqlite3.Connection:
+    """Open the cache database, creating it if needed."""
+    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(CACHE_FILE)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS search_cache "
+        "(key TEXT PRIMARY KEY, isbn TEXT NOT NULL, items TEXT NOT NULL, ts INTEGER NOT NULL)"
+    )
+    return conn
+
+
+def get_canonical_match(
+    query: str, stores: list[str], ttl: int = DEFAULT_TTL
+) -> tuple[str, dict[str, dict]] | None:
+    """Look up the cached canonical ISBN and matching search results for a query.
+
+    Args:
+        query: Book title as typed by the user.
+        stores: Names of the stores searched.
+        ttl: Maximum age of the entry in seconds.
+
+    Returns:
+        (isbn, items), where items maps a store name to the "url" and "title"
+        of its search result for the ISBN (stores that didn't list it are left
+        out). None on a miss, an expired entry, or a cache error.
+    """
+    try:
+        with closing(_connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT isbn, items FROM search_cache WHERE key = ? AND ts >= ?",
+                (_cache_key(query, stores), int(time.time()) - ttl),
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+    except (sqlite3.Error, OSError, ValueError):
+        return None
+
+
+def set_canonical_match(query: str, stores: list[str], isbn: str, items: dict[str, dict]) -> None:
+    """Store the canonical ISBN and matching search results for a query.
+
+    Cache errors are ignored.
+    """
+    try:
+        with closing(_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO search_cache (key, isbn, items, ts) VALUES (?, ?, ?, ?)",
+                (_cache_key(query, stores), isbn, json.dumps(items), int(time.time())),
+            )
+    except (sqlite3.Error, OSError):
+        pass
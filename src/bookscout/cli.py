@@ -1,24 +1,59 @@
 """BookScout CLI - Book price comparison tool."""
 
 import asyncio
+import csv
+import io
 import json
-from collections import Counter
+import re
+import sys
+import urllib.parse
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from contextlib import AsyncExitStack
 from enum import Enum
+from pathlib import Path
 from typing import Annotated
 
+import httpx
 import typer
-from playwright.async_api import async_playwright
+from playwright.async_api import Browser
 from rich.console import Console
 from rich.table import Table
+from typer.core import TyperGroup
 
+from bookscout import cache, daemon
 from bookscout.models import BookResult, parse_price
 from bookscout.scrapers import BlackwellsScraper, KennysScraper, LibristoScraper, WorderyScraper
+from bookscout.scrapers.base import SearchResultItem, create_http_client, new_browser_context
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, installed with the "fast" extra
+    orjson = None
+
+
+class DefaultSearchGroup(TyperGroup):
+    """Command group that runs `search` when no command is named.
+
+    Keeps `bookscout "Atomic Habits"` and `bookscout --isbn ...` working now
+    that there are other commands (`batch`, `daemon`).
+    """
+
+    def parse_args(self, ctx: typer.Context, args: list[str]) -> list[str]:
+        group_opts = {opt for param in self.get_params(ctx) for opt in param.opts}
+        if args and args[0] not in self.commands and args[0] not in group_opts:
+            args = ["search", *args]
+        return super().parse_args(ctx, args)
+
 
 app = typer.Typer(
     name="bookscout",
+    cls=DefaultSearchGroup,
     help="Compare book prices across Blackwells, Kennys, Libristo, and Wordery.",
     no_args_is_help=True,
 )
+daemon_app = typer.Typer(help="Manage a shared background Chromium to skip browser startup.")
+app.add_typer(daemon_app, name="daemon")
 console = Console()
 
 
@@ -46,16 +81,30 @@ SCRAPER_MAP = {
     Store.wordery: WorderyScraper,
 }
 
+CSV_HEADER = ["store", "title", "price", "url", "isbn"]
+
+# Maximum concurrent page loads against a single host (avoids 429s/blocking)
+MAX_REQUESTS_PER_HOST = 2
+
+# Characters json.dumps escapes with ensure_ascii, beyond those orjson escapes
+_NON_ASCII_RE = re.compile(r"[\x7f-\U0010ffff]")
+
 
 def find_canonical_isbn(isbns: list[str]) -> str | None:
     """Find the most common ISBN from a list (majority vote)."""
     if not isbns:
         return None
-    counter = Counter(isbns)
-    most_common = counter.most_common(1)
-    if most_common:
-        return most_common[0][0]
-    return None
+
+    counts: dict[str, int] = {}
+    majority = len(isbns) // 2
+    for isbn in isbns:
+        count = counts[isbn] = counts.get(isbn, 0) + 1
+        # A strict majority can't be overtaken by the remaining stores
+        if count > majority:
+            return isbn
+
+    # Ties go to the ISBN seen first, as with Counter.most_common()
+    return max(counts, key=counts.__getitem__)
 
 
 def find_canonical_isbn_weighted(
@@ -85,28 +134,53 @@ def find_canonical_isbn_weighted(
             Set to 1.0 to disable penalty.
             See: https://www.isbn-international.org/content/changes-united-states-isbn-prefixes
     """
-    isbn_scores: dict[str, float] = {}
+    # Fast path: every store whose top hit has an ISBN agrees on it. A rival can
+    # score at most 1/2 per store (position 2 or lower), so the full scoring
+    # can't change the winner as long as those stores outnumber the ones whose
+    # top hit has no ISBN (e.g. Libristo).
+    leaders = [results[0].isbn for results in store_results if results]
+    leader_isbns = [isbn for isbn in leaders if isbn]
+    if (
+        leader_isbns
+        and len(set(leader_isbns)) == 1
+        and not leader_isbns[0].startswith("9798")
+        and len(leader_isbns) > len(leaders) - len(leader_isbns)
+    ):
+        return leader_isbns[0]
+
+    isbn_scores: defaultdict[str, float] = defaultdict(float)
 
     for results in store_results:
         seen_in_store: set[str] = set()
         for position, item in enumerate(results, start=1):
-            if item.isbn and item.isbn not in seen_in_store:
-                seen_in_store.add(item.isbn)
-                # Score = 1/position (position 1 = 1.0, position 2 = 0.5, etc.)
-                score = 1.0 / position
-                isbn_scores[item.isbn] = isbn_scores.get(item.isbn, 0) + score
+            isbn = item.isbn
+            if not isbn or isbn in seen_in_store:
+                continue
+            seen_in_store.add(isbn)
+
+            # Score = 1/position (position 1 = 1.0, position 2 = 0.5, etc.)
+            isbn_scores[isbn] += 1.0 / position
 
     if not isbn_scores:
         return None
 
-    # Penalize ISBNs starting with 979-8 (often self-published knockoffs)
-    if self_pub_penalty < 1.0:
-        for isbn in isbn_scores:
-            if isbn.startswith("9798"):
-                isbn_scores[isbn] *= self_pub_penalty
+    # Penalize ISBNs starting with 979-8 (often self-published knockoffs). Scaling
+    # the summed score, rather than each term, keeps exact ties exact.
+    for isbn in isbn_scores:
+        if isbn.startswith("9798"):
+            isbn_scores[isbn] *= self_pub_penalty
+
+    # Return ISBN with highest score; ties go to the ISBN seen first
+    return max(isbn_scores, key=isbn_scores.__getitem__)
+
 
-    # Return ISBN with highest score
-    return max(isbn_scores, key=isbn_scores.get)
+def stores_needing_retry(results: list[BookResult | None], canonical_isbn: str) -> list[int]:
+    """Find the stores whose result is missing or has a different ISBN.
+
+    Returns:
+        Indices into results, in order.
+    """
+    return [i for i, result in enumerate(results) if result is None or (result.isbn and result.isbn != canonical_isbn)]
 
 
 def find_canonical_isbn_from_results(results: list[BookResult | None]) -> str | None:
@@ -120,6 +194,14 @@ async def run_scrapers(
     stores: list[Store],
     isbn_mode: bool = False,
     validate_isbn: bool = True,
+    max_concurrency: int = 5,
+    use_cache: bool = True,
+    browser: Browser | None = None,
+    get_browser: Callable[[], Awaitable[Browser]] | None = None,
+    client: httpx.AsyncClient | None = None,
+    details_cache: dict | None = None,
+    page_sem: asyncio.Semaphore | None = None,
+    host_sems: dict[str, asyncio.Semaphore] | None = None,
 ) -> list[BookResult | None]:
     """Run scrapers in parallel and return results.
 
@@ -127,16 +209,108 @@ async def run_scrapers(
     1. Extract ISBNs from search results pages (fast, no product page visits)
     2. Find canonical ISBN via majority vote across all search results
     3. Fetch product details only for the correct ISBN
+
+    With use_cache, the canonical ISBN found in step 2 and the product pages
+    matching it are remembered per query and store selection, so later runs
+    only repeat step 1 for stores that don't need a browser (see bookscout.cache).
+
+    Chromium is only started once a store needs it, so searches answered by
+    plain-HTML search results (and cached lookups) never launch it. If
+    `bookscout daemon start` is running, its browser is reused instead.
+
+    Product page loads and ISBN searches are bounded by page_sem overall and
+    by MAX_REQUESTS_PER_HOST per store host, through the semaphores in
+    host_sems. Callers running several queries at once should pass the same
+    ones to every call; otherwise each call gets its own, with page_sem
+    allowing max_concurrency page loads.
+
+    A browser and HTTP client passed in by the caller are used as-is and left
+    open, so several queries can share them (see run_scrapers_many). So is
+    the browser returned by get_browser, which is only called once a store
+    needs Chromium and lets the caller start a shared one lazily. The same
+    goes for details_cache, which maps product URLs and (store, ISBN) pairs to
+    the task fetching them by product page or ISBN search, finished or not.
     """
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
+    async with AsyncExitStack() as stack:
+        if client is None:
+            client = await stack.enter_async_context(create_http_client())
+
+        owns_browser = browser is None and get_browser is None
+
+        scrapers = [SCRAPER_MAP[store](client=client) for store in stores]
+
+        sem = asyncio.Semaphore(max_concurrency) if page_sem is None else page_sem
+        if host_sems is None:
+            host_sems = {}
+
+        def host_semaphore(url: str) -> asyncio.Semaphore:
+            """Get the semaphore limiting concurrent requests to url's host."""
+            host = urllib.parse.urlparse(url).netloc
+            if host not in host_sems:
+                host_sems[host] = asyncio.Semaphore(MAX_REQUESTS_PER_HOST)
+            return host_sems[host]
+
+        async def shared_lookup(key, fetch: Callable[[], Awaitable[BookResult | None]]) -> BookResult | None:
+            """Run fetch at most once per key in details_cache and share its result.
+
+            Concurrent callers with the same key await the same in-flight task.
+            A failed fetch is dropped from the cache so a later caller can retry;
+            a caller that was only waiting on another query's fetch retries with
+            its own right away.
+            """
+            if details_cache is None:
+                return await fetch()
+            task = details_cache.get(key)
+            started_here = task is None
+            if started_here:
+                task = details_cache[key] = asyncio.ensure_future(fetch())
+            try:
+                return await asyncio.shield(task)
+            except Exception:
+                if details_cache.get(key) is task:
+                    del details_cache[key]
+                if started_here:
+                    raise
+            return await shared_lookup(key, fetch)
+
+        attach_lock = asyncio.Lock()
+
+        async def attach_browser() -> None:
+            """Start Chromium if needed and give every scraper its own context.
+
+            Safe to call from concurrent lookups; only the first one attaches.
+            """
+            nonlocal browser
+            async with attach_lock:
+                if scrapers[0].browser is not None:
+                    return
+                if browser is None and get_browser is not None:
+                    browser = await get_browser()
+                elif browser is None:
+                    browser = await daemon.launch_browser(await daemon.get_playwright())
+                contexts = await asyncio.gather(*[new_browser_context(browser) for _ in scrapers])
+                for scraper, context in zip(scrapers, contexts):
+                    scraper.browser = browser
+                    scraper.context = context
 
         try:
-            scrapers = [SCRAPER_MAP[store](browser) for store in stores]
-
             if isbn_mode:
-                # Direct ISBN search - no validation needed
-                tasks = [scraper.search_isbn(query) for scraper in scrapers]
+                # Direct ISBN search - no validation needed. A store searched for this
+                # ISBN elsewhere in the batch, even one still in flight, shares that
+                # lookup through details_cache, and the browser is only attached for
+                # a search this query has to run itself.
+                cache_keys = [(scraper.name, query) for scraper in scrapers]
+
+                async def search_isbn(scraper):
+                    """Search a store by ISBN within the page load limits."""
+                    await attach_browser()
+                    async with sem, host_semaphore(scraper.base_url):
+                        return await scraper.search_isbn(query)
+
+                tasks = [
+                    shared_lookup(key, lambda scraper=scraper: search_isbn(scraper))
+                    for scraper, key in zip(scrapers, cache_keys)
+                ]
                 results = await asyncio.gather(*tasks, return_exceptions=True)
 
                 processed: list[BookResult | None] = []
@@ -149,52 +323,123 @@ async def run_scrapers(
 
             # Two-phase approach for title search with ISBN validation
             if validate_isbn:
-                # Phase 1: Get search results (ISBNs) from all stores in parallel
-                search_tasks = [scraper.get_search_results(query) for scraper in scrapers]
-                search_results = await asyncio.gather(*search_tasks, return_exceptions=True)
+                # An earlier run of this query over the same stores left the canonical
+                # ISBN and the product page each store listed for it. Stores whose
+                # search results are plain HTML are still searched (it's cheap, and
+                # their result cards show current prices); the others skip Phase 1.
+                store_names = [scraper.name for scraper in scrapers]
+                cached = cache.get_canonical_match(query, store_names) if use_cache else None
+                store_search_results: list[list] = [[] for _ in scrapers]
+
+                if cached is not None:
+                    canonical_isbn, cached_items = cached
+                    searched = [i for i, scraper in enumerate(scrapers) if scraper.html_search]
+                    for i, name in enumerate(store_names):
+                        if i not in searched and name in cached_items:
+                            store_search_results[i] = [SearchResultItem(isbn=canonical_isbn, **cached_items[name])]
+                else:
+                    searched = list(range(len(scrapers)))
+                    # Only wait for the browser if some store needs JS for its search results
+                    if not all(scraper.html_search for scraper in scrapers):
+                        await attach_browser()
 
-                # Collect search results from all stores
-                store_search_results: list[list] = []
+                # Phase 1: Get search results (ISBNs) from the stores in parallel
+                search_tasks = [scrapers[i].get_search_results(query) for i in searched]
+                search_results = await asyncio.gather(*search_tasks, return_exceptions=True)
 
-                for result in search_results:
-                    if isinstance(result, Exception) or not result:
-                        store_search_results.append([])
-                    else:
-                        store_search_results.append(result)
+                # Collect search results from the stores searched
+                for i, result in zip(searched, search_results):
+                    if not isinstance(result, Exception) and result:
+                        store_search_results[i] = result
 
-                # Find canonical ISBN using weighted scoring (frequency + ranking)
-                canonical_isbn = find_canonical_isbn_weighted(store_search_results)
+                if cached is None:
+                    # Find canonical ISBN using weighted scoring (frequency + ranking)
+                    canonical_isbn = find_canonical_isbn_weighted(store_search_results)
 
                 if canonical_isbn:
-                    # Phase 2: For each store, find the URL with matching ISBN and fetch details
+                    # Search result for the canonical ISBN in each store, if it was listed
+                    matching_items = [
+                        next((item for item in search_items if item.isbn == canonical_isbn), None)
+                        for search_items in store_search_results
+                    ]
+
+                    if use_cache and cached is None:
+                        cache.set_canonical_match(
+                            query,
+                            store_names,
+                            canonical_isbn,
+                            {
+                                name: {"url": item.url, "title": item.title}
+                                for name, item in zip(store_names, matching_items)
+                                if item
+                            },
+                        )
+
+                    # Phase 2: For each store, fetch details for the URL with matching ISBN
                     # Build tasks for parallel execution
-                    async def fetch_details(scraper, search_items, isbn):
+                    async def fetch_details(scraper, item, isbn):
                         """Fetch product details for a single store."""
-                        # Find the URL with matching ISBN
-                        matching_url = None
-                        for item in search_items:
-                            if item.isbn == isbn:
-                                matching_url = item.url
-                                break
+                        # A results page that already showed title and price needs no browser
+                        if item and item.price and item.title:
+                            return BookResult(
+                                store=scraper.name,
+                                title=item.title,
+                                price=item.price,
+                                url=item.url,
+                                isbn=isbn,
+                            )
+
+                        matching_url = item.url if item else None
+
+                        async def fetch():
+                            """Load the product page, or search by ISBN if the store didn't list it."""
+                            await attach_browser()
+                            async with sem, host_semaphore(matching_url or scraper.base_url):
+                                if matching_url:
+                                    return await scraper.get_product_details(matching_url)
+                                return await scraper.search_isbn(isbn)
 
                         try:
-                            if matching_url:
-                                return await scraper.get_product_details(matching_url)
-                            else:
-                                return await scraper.search_isbn(isbn)
+                            return await shared_lookup(matching_url or (scraper.name, isbn), fetch)
                         except Exception:
                             return None
 
                     # Run all product detail fetches in parallel
                     detail_tasks = [
-                        fetch_details(scraper, store_search_results[i], canonical_isbn)
+                        fetch_details(scraper, matching_items[i], canonical_isbn)
                         for i, scraper in enumerate(scrapers)
                     ]
-                    processed = await asyncio.gather(*detail_tasks)
+                    processed = list(await asyncio.gather(*detail_tasks))
+
+                    # Product pages that failed or showed another edition get one more
+                    # chance via ISBN search, all in a single concurrent round. Stores
+                    # that already searched by ISBN would only repeat the same lookup.
+                    # Other queries in the batch retrying the same book share the search.
+                    retry_indices = [
+                        i for i in stores_needing_retry(processed, canonical_isbn) if matching_items[i]
+                    ]
 
-                    return list(processed)
+                    async def retry(scraper):
+                        """Search a store by the canonical ISBN."""
+                        await attach_browser()
+                        async with sem, host_semaphore(scraper.base_url):
+                            return await scraper.search_isbn(canonical_isbn)
+
+                    retries = await asyncio.gather(
+                        *[
+                            shared_lookup((scrapers[i].name, canonical_isbn), lambda scraper=scrapers[i]: retry(scraper))
+                            for i in retry_indices
+                        ],
+                        return_exceptions=True,
+                    )
+                    for i, result in zip(retry_indices, retries):
+                        if isinstance(result, BookResult):
+                            processed[i] = result
+
+                    return processed
 
             # Fallback: old approach (no two-phase, or no canonical ISBN found)
+            await attach_browser()
             tasks = [scraper.search(query) for scraper in scrapers]
             results = await asyncio.gather(*tasks, return_exceptions=True)
 
@@ -207,7 +452,77 @@ async def run_scrapers(
 
             return processed
         finally:
-            await browser.close()
+            await asyncio.gather(*[scraper.aclose() for scraper in scrapers])
+            if owns_browser and browser is not None:
+                await browser.close()
+
+
+async def run_scrapers_many(
+    queries: list[str],
+    stores: list[Store],
+    isbn_mode: bool = False,
+    max_concurrency: int = 5,
+    use_cache: bool = True,
+) -> list[list[BookResult | None]]:
+    """Run run_scrapers for many queries on one shared browser and HTTP client.
+
+    Browser startup is paid at most once for the whole batch instead of per
+    query, and only if some query needs Chromium. A product page is fetched at most once even if several queries
+    resolve to the same book. At most max_concurrency queries run at the
+    same time, and the page load limits of run_scrapers (max_concurrency
+    overall, MAX_REQUESTS_PER_HOST per store host) hold for the whole batch.
+
+    Returns:
+        One result list per query, in the order of queries.
+    """
+    async with create_http_client() as client:
+        launch: asyncio.Task[Browser] | None = None
+
+        async def start_browser() -> Browser:
+            """Attach to the daemon's Chromium or cold-launch one."""
+            return await daemon.launch_browser(await daemon.get_playwright())
+
+        async def get_browser() -> Browser:
+            """Start the batch's browser on first use; later callers share it."""
+            nonlocal launch
+            if launch is None:
+                launch = asyncio.ensure_future(start_browser())
+            return await asyncio.shield(launch)
+
+        sem = asyncio.Semaphore(max_concurrency)
+        details_cache: dict = {}
+        # Shared by every query, so the limits apply to the batch as a whole
+        page_sem = asyncio.Semaphore(max_concurrency)
+        host_sems: dict[str, asyncio.Semaphore] = {}
+
+        async def run_one(query: str) -> list[BookResult | None]:
+            """Run a single query, turning a failure into an all-None row."""
+            async with sem:
+                try:
+                    return await run_scrapers(
+                        query,
+                        stores,
+                        isbn_mode,
+                        use_cache=use_cache,
+                        get_browser=get_browser,
+                        client=client,
+                        details_cache=details_cache,
+                        page_sem=page_sem,
+                        host_sems=host_sems,
+                    )
+                except Exception:
+                    return [None] * len(stores)
+
+        try:
+            return list(await asyncio.gather(*[run_one(query) for query in queries]))
+        finally:
+            if launch is not None:
+                try:
+                    browser = await launch
+                except Exception:
+                    pass  # Chromium never started; the affected queries already failed
+                else:
+                    await browser.close()
 
 
 def display_table(results: list[BookResult | None], stores: list[Store]) -> None:
@@ -241,8 +556,30 @@ def display_table(results: list[BookResult | None], stores: list[Store]) -> None
             console.print(f"  {r.store}: {r.price}")
 
 
-def display_json(results: list[BookResult | None], stores: list[Store]) -> None:
-    """Display results as JSON with normalized price/currency."""
+def _escape_non_ascii(match: re.Match[str]) -> str:
+    """Escape one character as json.dumps does with ensure_ascii."""
+    code = ord(match.group())
+    if code > 0xFFFF:
+        # Characters outside the BMP become a UTF-16 surrogate pair
+        code -= 0x10000
+        return f"\\u{0xD800 | (code >> 10):04x}\\u{0xDC00 | (code & 0x3FF):04x}"
+    return f"\\u{code:04x}"
+
+
+def dumps_json(data: object) -> str:
+    """Serialize to indented JSON, using orjson when it is installed.
+
+    Both paths give the same ASCII-only output, so it prints on any console
+    encoding. orjson always emits UTF-8, so its non-ASCII characters are
+    escaped afterwards; it already escapes control characters itself.
+    """
+    if orjson is not None:
+        return _NON_ASCII_RE.sub(_escape_non_ascii, orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
+    return json.dumps(data, indent=2)
+
+
+def results_to_dicts(results: list[BookResult | None], stores: list[Store]) -> list[dict]:
+    """Convert results to JSON-ready dicts with normalized price/currency."""
     output = []
     for store, result in zip(stores, results):
         if result:
@@ -264,20 +601,35 @@ def display_json(results: list[BookResult | None], stores: list[Store]) -> None:
                 "url": None,
                 "isbn": None,
             })
+    return output
 
-    console.print(json.dumps(output, indent=2))
 
+def display_json(results: list[BookResult | None], stores: list[Store]) -> None:
+    """Display results as JSON with normalized price/currency."""
+    # Written straight to stdout: rich would parse markup and wrap long lines
+    sys.stdout.write(dumps_json(results_to_dicts(results, stores)) + "\n")
 
-def display_csv(results: list[BookResult | None], stores: list[Store]) -> None:
-    """Display results as CSV."""
-    console.print("store,title,price,url,isbn")
+
+def csv_rows(results: list[BookResult | None], stores: list[Store]) -> list[list[str]]:
+    """Convert results to CSV rows (without header)."""
+    rows = []
     for store, result in zip(stores, results):
         if result:
-            # Escape quotes in title
-            title = result.title.replace('"', '""')
-            console.print(f'{result.store},"{title}","{result.price}",{result.url},{result.isbn or ""}')
+            rows.append([result.store, result.title, result.price, result.url, result.isbn or ""])
         else:
-            console.print(f'{store.value.capitalize()},"","Not found","",""')
+            rows.append([store.value.capitalize(), "", "Not found", "", ""])
+    return rows
+
+
+def display_csv(results: list[BookResult | None], stores: list[Store]) -> None:
+    """Display results as CSV."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(CSV_HEADER)
+    writer.writerows(csv_rows(results, stores))
+
+    # Written in one go straight to stdout: rich would parse markup and wrap long lines
+    sys.stdout.write(buffer.getvalue())
 
 
 @app.command()
@@ -298,6 +650,10 @@ def search(
         list[Store] | None,
         typer.Option("--store", "-s", help="Specific stores to search (can be repeated)"),
     ] = None,
+    use_cache: Annotated[
+        bool,
+        typer.Option("--cache/--no-cache", help="Reuse the ISBN found by earlier searches for the same title"),
+    ] = True,
 ) -> None:
     """Search for a book across bookstores and compare prices."""
     # Determine search query
@@ -315,8 +671,14 @@ def search(
     stores = store if store else list(Store)
 
     # Show progress
+    async def run() -> list[BookResult | None]:
+        try:
+            return await run_scrapers(search_query, stores, isbn_mode, use_cache=use_cache)
+        finally:
+            await daemon.stop_playwright()
+
     with console.status(f"[bold green]Searching for '{search_query}'..."):
-        results = asyncio.run(run_scrapers(search_query, stores, isbn_mode))
+        results = asyncio.run(run())
 
     # Display results
     if format == OutputFormat.table:
@@ -327,5 +689,103 @@ def search(
         display_csv(results, stores)
 
 
+@app.command()
+def batch(
+    file: Annotated[
+        Path,
+        typer.Argument(help="File with one book title (or ISBN with --isbn) per line", exists=True, dir_okay=False),
+    ],
+    isbn: Annotated[
+        bool,
+        typer.Option("--isbn", "-i", help="Lines are ISBNs instead of titles"),
+    ] = False,
+    format: Annotated[
+        OutputFormat,
+        typer.Option("--format", "-f", help="Output format"),
+    ] = OutputFormat.table,
+    store: Annotated[
+        list[Store] | None,
+        typer.Option("--store", "-s", help="Specific stores to search (can be repeated)"),
+    ] = None,
+    max_concurrency: Annotated[
+        int,
+        typer.Option("--max-concurrency", "-c", help="Maximum number of queries searched at once", min=1),
+    ] = 5,
+    use_cache: Annotated[
+        bool,
+        typer.Option("--cache/--no-cache", help="Reuse the ISBN found by earlier searches for the same title"),
+    ] = True,
+) -> None:
+    """Search for many books at once, sharing one browser across all of them."""
+    queries = [line.strip() for line in file.read_text().splitlines() if line.strip()]
+    if not queries:
+        console.print(f"[red]Error:[/red] No queries found in {file}")
+        raise typer.Exit(1)
+
+    stores = store if store else list(Store)
+
+    async def run() -> list[list[BookResult | None]]:
+        try:
+            return await run_scrapers_many(queries, stores, isbn, max_concurrency, use_cache)
+        finally:
+            await daemon.stop_playwright()
+
+    with console.status(f"[bold green]Searching for {len(queries)} books..."):
+        all_results = asyncio.run(run())
+
+    if format == OutputFormat.table:
+        for query, results in zip(queries, all_results):
+            console.rule(f"[bold]{query}")
+            display_table(results, stores)
+    elif format == OutputFormat.json:
+        output = [
+            {"query": query, "results": results_to_dicts(results, stores)}
+            for query, results in zip(queries, all_results)
+        ]
+        sys.stdout.write(dumps_json(output) + "\n")
+    elif format == OutputFormat.csv:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(["query", *CSV_HEADER])
+        for query, results in zip(queries, all_results):
+            writer.writerows([query, *row] for row in csv_rows(results, stores))
+        sys.stdout.write(buffer.getvalue())
+
+
+@daemon_app.command("start")
+def daemon_start(
+    port: Annotated[
+        int,
+        typer.Option("--port", "-p", help="Remote debugging port for Chromium"),
+    ] = daemon.DEFAULT_PORT,
+) -> None:
+    """Start a background Chromium that later searches attach to."""
+    try:
+        state = daemon.start_daemon(port)
+    except RuntimeError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    console.print(f"Daemon running (pid {state['pid']}) at {state['endpoint']}")
+
+
+@daemon_app.command("stop")
+def daemon_stop() -> None:
+    """Stop the background Chromium."""
+    if daemon.stop_daemon():
+        console.print("Daemon stopped")
+    else:
+        console.print("Daemon not running")
+
+
+@daemon_app.command("status")
+def daemon_status() -> None:
+    """Show whether the background Chromium is running."""
+    state = daemon.read_state()
+    if state:
+        console.print(f"Daemon running (pid {state['pid']}) at {state['endpoint']}")
+    else:
+        console.print("Daemon not running")
+
+
 if __name__ == "__main__":
     app()
@@ -0,0 +1,210 @@
+"""Shared Chromium daemon for BookScout.
+
+Launching Chromium costs 1-2s per CLI invocation. `bookscout daemon start`
+runs one headless Chromium in the background with a remote debugging port,
+and later invocations attach to it over CDP instead of cold-launching.
+
+The daemon keeps a persistent profile under ~/.cache/bookscout, so its
+shader, DNS and HTTP caches stay warm between searches. Cold launches stay
+profile-less: a user-data-dir can only be opened by one Chromium at a time,
+which would serialize concurrent bookscout runs.
+"""
+
+import asyncio
+import json
+import os
+import signal
+import subprocess
+import time
+
+import httpx
+from playwright.async_api import Browser, Playwright, async_playwright
+from playwright.sync_api import sync_playwright
+
+from bookscout.cache import CACHE_DIR
+
+STATE_FILE = CACHE_DIR / "cdp.json"
+PROFILE_DIR = CACHE_DIR / "chromium-profile"
+DEFAULT_PORT = 9222
+PROFILE_DISK_CACHE_BYTES = 50_000_000
+
+# Chromium flags that trim memory and skip work the scrapers never need
+CHROMIUM_ARGS = [
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--blink-settings=imagesEnabled=false",
+]
+
+# Task starting the Playwright driver shared by every run_scrapers() call on the same event loop
+_playwright_start: asyncio.Task[Playwright] | None = None
+_playwright_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a process with the given PID exists."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def read_state() -> dict | None:
+    """Read the daemon state file.
+
+    Returns:
+        Dict with "pid" and "endpoint" if a daemon is running, None otherwise.
+        A state file left behind by a dead daemon is removed.
+    """
+    try:
+        state = json.loads(STATE_FILE.read_text())
+    except (FileNotFoundError, ValueError):
+        return None
+
+    if not isinstance(state, dict) or "pid" not in state or "endpoint" not in state:
+        return None
+
+    if not _pid_alive(state["pid"]):
+        STATE_FILE.unlink(missing_ok=True)
+        return None
+
+    return state
+
+
+def read_endpoint() -> str | None:
+    """Return the CDP endpoint of the running daemon, if any."""
+    state = read_state()
+    return state["endpoint"] if state else None
+
+
+def start_daemon(port: int = DEFAULT_PORT, timeout: float = 10.0) -> dict:
+    """Launch a detached headless Chromium and record its CDP endpoint.
+
+    Args:
+        port: Remote debugging port for Chromium to listen on.
+        timeout: Seconds to wait for the debugging endpoint to come up.
+
+    Returns:
+        The daemon state ("pid" and "endpoint").
+
+    Raises:
+        RuntimeError: If Chromium does not expose its endpoint in time.
+    """
+    state = read_state()
+    if state:
+        return state
+
+    with sync_playwright() as p:
+        executable = p.chromium.executable_path
+
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    process = subprocess.Popen(
+        [
+            executable,
+            "--headless=new",
+            f"--remote-debugging-port={port}",
+            f"--user-data-dir={PROFILE_DIR}",
+            f"--disk-cache-size={PROFILE_DISK_CACHE_BYTES}",
+            "--no-first-run",
+            "--no-default-browser-check",
+            *CHROMIUM_ARGS,
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+    endpoint = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"{endpoint}/json/version", timeout=1).raise_for_status()
+            break
+        except httpx.HTTPError:
+            if process.poll() is not None:
+                raise RuntimeError(f"Chromium exited with code {process.returncode}")
+            time.sleep(0.1)
+    else:
+        process.terminate()
+        raise RuntimeError(f"Chromium did not open {endpoint} within {timeout}s")
+
+    state = {"pid": process.pid, "endpoint": endpoint}
+    STATE_FILE.write_text(json.dumps(state))
+    return state
+
+
+def stop_daemon() -> bool:
+    """Stop the running daemon.
+
+    Returns:
+        True if a daemon was stopped, False if none was running.
+    """
+    state = read_state()
+    STATE_FILE.unlink(missing_ok=True)
+    if not state:
+        return False
+
+    try:
+        os.kill(state["pid"], signal.SIGTERM)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+async def get_playwright() -> Playwright:
+    """Return the shared Playwright driver, starting it on first use.
+
+    Starting Playwright spawns its Node driver subprocess, so it is done once
+    per event loop rather than once per search. Concurrent first callers
+    await the same start instead of each spawning a driver. Call
+    stop_playwright() before the loop closes.
+    """
+    global _playwright_start, _playwright_loop
+
+    loop = asyncio.get_running_loop()
+    if _playwright_start is None or _playwright_loop is not loop:
+        _playwright_start = loop.create_task(async_playwright().start())
+        _playwright_loop = loop
+
+    start = _playwright_start
+    try:
+        return await asyncio.shield(start)
+    except Exception:
+        # Let the next caller try again rather than re-raise this failure forever
+        if _playwright_start is start:
+            _playwright_start = None
+            _playwright_loop = None
+        raise
+
+
+async def stop_playwright() -> None:
+    """Stop the shared Playwright driver if it was started."""
+    global _playwright_start, _playwright_loop
+
+    start, _playwright_start, _playwright_loop = _playwright_start, None, None
+    if start is None:
+        return
+    try:
+        playwright = await start
+    except Exception:
+        return  # The driver never started
+    await playwright.stop()
+
+
+async def launch_browser(p: Playwright) -> Browser:
+    """Attach to the daemon's Chromium if it is running, else cold-launch one.
+
+    Closing a browser obtained over CDP only disconnects from it (and drops the
+    contexts this process created), so the daemon keeps running.
+    """
+    endpoint = read_endpoint()
+    if endpoint:
+        try:
+            return await p.chromium.connect_over_cdp(endpoint)
+        except Exception:
+            pass  # Daemon unreachable, fall back to a cold launch
+
+    return await p.chromium.launch(headless=True, args=CHROMIUM_ARGS)
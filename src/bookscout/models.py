@@ -2,9 +2,10 @@
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BookResult:
     """Result from a bookstore search."""
 
@@ -15,7 +16,7 @@ class BookResult:
     isbn: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParsedPrice:
     """Parsed price with numeric value and currency code."""
 
@@ -38,9 +39,47 @@ CURRENCY_MAP = {
 }
 
 
+# Optional currency symbol, the number, optional trailing currency symbol
+_PRICE_RE = re.compile(r"(?P<sym>[€£$¥]|CHF|kr)?\s*(?P<num>\d[\d.,]*)\s*(?P<sym2>[€£$¥]|CHF|kr)?")
+_NUMBER_RE = re.compile(r"\d+\.?\d*")
+
+# "1.234,56" -> "1234.56" (period is thousands separator, comma is decimal)
+_EUROPEAN_THOUSANDS = str.maketrans({".": None, ",": "."})
+# "42,99" -> "42.99"
+_DECIMAL_COMMA = str.maketrans(",", ".")
+
+
+# Single-character currency symbols, for checking the ends of a price string
+_SYMBOL_LOOKUP = {symbol: code for symbol, code in CURRENCY_MAP.items() if len(symbol) == 1}
+
+
+def _detect_currency(price_str: str) -> str | None:
+    """Find any known currency symbol in the string.
+
+    The symbol is almost always the first or last character, so those are
+    checked with a dict lookup before scanning the whole string.
+    """
+    price_str = price_str.strip()
+    if not price_str:
+        return None
+
+    code = _SYMBOL_LOOKUP.get(price_str[0]) or _SYMBOL_LOOKUP.get(price_str[-1])
+    if code:
+        return code
+
+    for symbol, code in CURRENCY_MAP.items():
+        if symbol in price_str:
+            return code
+    return None
+
+
+@lru_cache(maxsize=1024)
 def parse_price(price_str: str) -> ParsedPrice:
     """Parse a price string into amount and currency.
 
+    Results are cached, since stores repeat the same price strings across
+    results and ParsedPrice is immutable.
+
     Handles formats like:
     - "€42.32", "€ 42.32"
     - "42,99 €", "42.99€"
@@ -54,38 +93,20 @@ def parse_price(price_str: str) -> ParsedPrice:
     if not price_str or price_str in ("N/A", "Not found", "-"):
         return ParsedPrice(amount=None, currency=None)
 
-    # Clean up the string
-    price_str = price_str.strip()
+    match = _PRICE_RE.search(price_str)
+    if not match:
+        return ParsedPrice(amount=None, currency=_detect_currency(price_str))
 
-    # Detect currency
-    currency = None
-    for symbol, code in CURRENCY_MAP.items():
-        if symbol in price_str:
-            currency = code
-            break
-
-    # Extract numeric value
-    # Remove currency symbols and whitespace, keeping digits, comma, period
-    numeric_str = re.sub(r"[€£$¥]", "", price_str)
-    numeric_str = numeric_str.replace("CHF", "").replace("kr", "").strip()
+    # Symbol next to the number is a dict hit; otherwise scan the whole string
+    symbol = match["sym"] or match["sym2"]
+    currency = CURRENCY_MAP[symbol] if symbol else _detect_currency(price_str)
 
     # Handle European format (comma as decimal separator)
-    # If we have both comma and period, comma is thousands separator
+    # If we have both comma and period, comma is decimal and period is thousands separator
     # If we have only comma, it's likely decimal separator
-    if "," in numeric_str and "." in numeric_str:
-        # Format like "1.234,56" -> remove dots, replace comma with dot
-        numeric_str = numeric_str.replace(".", "").replace(",", ".")
-    elif "," in numeric_str:
-        # Format like "42,99" -> replace comma with dot
-        numeric_str = numeric_str.replace(",", ".")
-
-    # Extract the number
-    match = re.search(r"(\d+\.?\d*)", numeric_str)
-    if match:
-        try:
-            amount = float(match.group(1))
-            return ParsedPrice(amount=amount, currency=currency)
-        except ValueError:
-            pass
-
-    return ParsedPrice(amount=None, currency=currency)
+    numeric_str = match["num"]
+    if "," in numeric_str:
+        numeric_str = numeric_str.translate(_EUROPEAN_THOUSANDS if "." in numeric_str else _DECIMAL_COMMA)
+
+    number = _NUMBER_RE.match(numeric_str)
+    return ParsedPrice(amount=float(number.group()), currency=currency)
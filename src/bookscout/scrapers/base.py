@@ -1,21 +1,71 @@
 """Base scraper class for bookstores."""
 
+import asyncio
 import re
+import urllib.parse
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import lru_cache
 
-from playwright.async_api import Browser, Page
+import httpx
+from playwright.async_api import Browser, BrowserContext, Page, Route
+from selectolax.lexbor import LexborHTMLParser
 
 from bookscout.models import BookResult
 
+_WORD_RE = re.compile(r"\w+")
 
-@dataclass
+# Resource types the scrapers never read; aborting them saves bandwidth and renderer memory.
+# Stylesheets are kept since inner_text() depends on CSS visibility.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create the HTTP client shared by all scrapers for plain-HTML fetches.
+
+    One pooled keep-alive client is used per CLI run so that requests to the
+    same store reuse their TCP/TLS connection.
+    """
+    return httpx.AsyncClient(
+        headers={"User-Agent": USER_AGENT},
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        http2=True,
+        timeout=30,
+        follow_redirects=True,
+    )
+
+
+async def _block_heavy_resources(route: Route) -> None:
+    """Abort requests for resources the scrapers don't need."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def new_browser_context(browser: Browser) -> BrowserContext:
+    """Create a browser context with the settings shared by all scrapers."""
+    context = await browser.new_context(user_agent=USER_AGENT, viewport={"width": 1280, "height": 800})
+    await context.route("**/*", _block_heavy_resources)
+    return context
+
+
+@dataclass(slots=True, frozen=True)
 class SearchResultItem:
     """A single item from search results (before fetching full details)."""
 
     isbn: str | None
     url: str
     title: str | None = None
+    price: str | None = None  # Only set when the results page shows the real title and price
+
+
+@lru_cache(maxsize=4096)
+def _tokenize(text: str) -> frozenset[str]:
+    """Split text into its set of lowercase words (alphanumeric only)."""
+    return frozenset(_WORD_RE.findall(text.lower()))
 
 
 def title_matches_query(title: str, query: str, threshold: float = 0.5) -> bool:
@@ -29,19 +79,14 @@ def title_matches_query(title: str, query: str, threshold: float = 0.5) -> bool:
     Returns:
         True if the title is a reasonable match for the query.
     """
-    # Normalize both strings
-    title_lower = title.lower()
-    query_lower = query.lower()
-
-    # Extract words (alphanumeric only)
-    query_words = set(re.findall(r"\w+", query_lower))
-    title_words = set(re.findall(r"\w+", title_lower))
-
+    # The query is the same for every candidate in a result list, so its
+    # words come straight from the cache after the first call
+    query_words = _tokenize(query)
     if not query_words:
         return True
 
     # Count how many query words appear in the title
-    matching_words = query_words & title_words
+    matching_words = query_words & _tokenize(title)
     match_ratio = len(matching_words) / len(query_words)
 
     return match_ratio >= threshold
@@ -51,16 +96,68 @@ class BaseScraper(ABC):
     """Abstract base class for bookstore scrapers."""
 
     name: str = "Unknown"
-
-    def __init__(self, browser: Browser) -> None:
+    base_url: str = ""
+    # True if get_search_results() only needs server-rendered HTML (no browser)
+    html_search: bool = False
+    # Cookie banner button to click, if the store shows one
+    cookie_accept_selector: str | None = None
+
+    def __init__(
+        self,
+        browser: Browser | None = None,
+        client: httpx.AsyncClient | None = None,
+        context: BrowserContext | None = None,
+    ) -> None:
         self.browser = browser
+        self.client = client
+        self.context = context
+        self._context_lock = asyncio.Lock()
+        self._cookies_accepted = False
 
     async def _new_page(self) -> Page:
-        """Create a new page with common settings."""
-        context = await self.browser.new_context(
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
-        return await context.new_page()
+        """Create a new page in this scraper's browser context.
+
+        All pages of one scraper share a single context (and so its cookies),
+        which is created on first use if none was passed in. The lock keeps
+        concurrent lookups from each creating their own.
+        """
+        if self.context is None:
+            async with self._context_lock:
+                if self.context is None:
+                    self.context = await new_browser_context(self.browser)
+        return await self.context.new_page()
+
+    async def _accept_cookies(self, page: Page) -> None:
+        """Dismiss the cookie banner if present.
+
+        The consent cookie is stored in this scraper's context, so once the
+        banner has been clicked later pages skip the lookup entirely.
+        """
+        if self._cookies_accepted or not self.cookie_accept_selector:
+            return
+        try:
+            accept_btn = await page.query_selector(self.cookie_accept_selector)
+            if accept_btn:
+                await accept_btn.click()
+                self._cookies_accepted = True
+        except Exception:
+            pass
+
+    async def aclose(self) -> None:
+        """Close this scraper's browser context, if it has one."""
+        if self.context is not None:
+            context, self.context = self.context, None
+            await context.close()
+
+    def _absolute_url(self, href: str) -> str:
+        """Resolve a link from one of this store's pages against its base URL."""
+        return urllib.parse.urljoin(self.base_url + "/", href)
+
+    async def _fetch_html(self, url: str) -> LexborHTMLParser:
+        """Fetch a page over HTTP, without a browser, and parse its HTML."""
+        response = await self.client.get(url)
+        response.raise_for_status()
+        return LexborHTMLParser(response.text)
 
     @abstractmethod
     async def search(self, query: str) -> BookResult | None:
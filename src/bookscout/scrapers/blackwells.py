@@ -4,17 +4,32 @@ import re
 import urllib.parse
 
 from playwright.async_api import TimeoutError as PlaywrightTimeout
+from selectolax.lexbor import LexborNode
 
 from bookscout.models import BookResult
 
 from .base import BaseScraper, SearchResultItem, title_matches_query
 
+_EURO_PRICE_RE = re.compile(r"(\d+[.,]\d{2}€)")
+
+# Price elements, most specific first to avoid grabbing "Save XX€" discount amounts
+PRICE_SELECTORS = [
+    ".product-price--current",   # Current/sale price (most specific)
+    ".product__price",           # Main product price container
+    ".product-price",            # Generic price container
+]
+
+# How far up from a product link to look for its search result card
+CARD_MAX_DEPTH = 5
+
 
 class BlackwellsScraper(BaseScraper):
     """Scraper for blackwells.co.uk."""
 
     name = "Blackwells"
     base_url = "https://blackwells.co.uk"
+    html_search = True
+    cookie_accept_selector = 'button:has-text("Accept All")'
 
     async def search(self, query: str) -> BookResult | None:
         """Search Blackwells for a book."""
@@ -42,46 +57,81 @@ class BlackwellsScraper(BaseScraper):
         return await self.search(isbn)
 
     async def get_search_results(self, query: str) -> list[SearchResultItem]:
-        """Extract ISBNs and URLs from search results without visiting product pages."""
+        """Extract ISBNs and URLs from search results without visiting product pages.
+
+        The search results page is server-rendered, so it is fetched over plain
+        HTTP instead of through the browser.
+        """
         encoded_query = urllib.parse.quote_plus(query)
         search_url = f"{self.base_url}/bookshop/search?keyword={encoded_query}"
 
-        page = await self._new_page()
-        try:
-            await page.goto(search_url, wait_until="domcontentloaded")
+        tree = await self._fetch_html(search_url)
 
-            try:
-                await page.wait_for_selector(".book-info, .product-info, .search-result", timeout=10000)
-            except PlaywrightTimeout:
-                return []
+        # Extract all product links with ISBNs from URLs
+        # URL format: /bookshop/product/Title-Slug/ISBN
+        links = tree.css('a[href*="/bookshop/product/"]')
+        results = []
+        seen_isbns = set()
 
-            # Extract all product links with ISBNs from URLs
-            # URL format: /bookshop/product/Title-Slug/ISBN
-            links = await page.query_selector_all('a[href*="/bookshop/product/"]')
-            results = []
-            seen_isbns = set()
+        for link in links[:15]:
+            href = link.attributes.get("href")
+            if not href:
+                continue
 
-            for link in links[:15]:
-                href = await link.get_attribute("href")
-                if not href:
+            # Extract ISBN from URL (last part)
+            parts = href.rstrip("/").rsplit("/", 2)
+            if parts:
+                potential_isbn = parts[-1]
+                # Check if it's a valid ISBN (10 or 13 digits)
+                if len(potential_isbn) >= 10 and potential_isbn.replace("X", "").replace("x", "").isdigit():
+                    if potential_isbn not in seen_isbns:
+                        seen_isbns.add(potential_isbn)
+                        url = self._absolute_url(href)
+                        # Prefer title and price from the result card; fall back to the URL slug
+                        title, price = self._extract_card_details(link, potential_isbn)
+                        if not title and len(parts) >= 2:
+                            title = parts[-2].replace("-by-", " ").replace("-", " ")
+                        results.append(SearchResultItem(isbn=potential_isbn, url=url, title=title, price=price))
+
+        return results
+
+    def _extract_card_details(self, link: LexborNode, isbn: str) -> tuple[str | None, str | None]:
+        """Find the title and price shown in the search result card around a product link.
+
+        Walks up from the link to the nearest ancestor holding a price element,
+        stopping before an ancestor that also contains links to other products.
+
+        Returns:
+            (title, price), both None unless the card shows a title and a price.
+        """
+        node = link.parent
+        for _ in range(CARD_MAX_DEPTH):
+            if node is None:
+                break
+
+            card_links = node.css('a[href*="/bookshop/product/"]')
+            if any(not (a.attributes.get("href") or "").rstrip("/").endswith(isbn) for a in card_links):
+                break  # Climbed past this product's card
+
+            for selector in PRICE_SELECTORS:
+                price_el = node.css_first(selector)
+                if not price_el:
                     continue
+                price_text = price_el.text()
 
-                # Extract ISBN from URL (last part)
-                parts = href.rstrip("/").split("/")
-                if parts:
-                    potential_isbn = parts[-1]
-                    # Check if it's a valid ISBN (10 or 13 digits)
-                    if len(potential_isbn) >= 10 and potential_isbn.replace("X", "").replace("x", "").isdigit():
-                        if potential_isbn not in seen_isbns:
-                            seen_isbns.add(potential_isbn)
-                            url = href if href.startswith("http") else f"{self.base_url}{href}"
-                            # Extract title from URL slug
-                            title = parts[-2].replace("-by-", " ").replace("-", " ") if len(parts) >= 2 else None
-                            results.append(SearchResultItem(isbn=potential_isbn, url=url, title=title))
-
-            return results
-        finally:
-            await page.close()
+                # Skip if this is a "Save" discount amount
+                if price_text.strip().lower().startswith("save"):
+                    continue
+
+                price_match = _EURO_PRICE_RE.search(price_text)
+                title = next((text for a in card_links if (text := a.text(strip=True))), None)
+                if price_match and title:
+                    return title, price_match.group(1)
+                return None, None
+
+            node = node.parent
+
+        return None, None
 
     async def get_product_details(self, url: str) -> BookResult | None:
         """Fetch full product details from a product page URL."""
@@ -93,21 +143,27 @@ class BlackwellsScraper(BaseScraper):
 
     async def _extract_first_result(self, page, query: str) -> BookResult | None:
         """Extract the first search result that matches the query."""
-        # Find all product links
-        links = await page.query_selector_all('a[href*="/bookshop/product/"]')
-        if not links:
+        # Collect the hrefs of the first 10 product links in one round-trip
+        hrefs = await page.evaluate("""() => Array.from(
+            document.querySelectorAll('a[href*="/bookshop/product/"]'),
+        ).slice(0, 10).map(a => a.getAttribute('href'))""")
+        hrefs = list(dict.fromkeys(href for href in hrefs if href))  # Deduplicate, keeping page order
+        if not hrefs:
             return None
 
-        # Try each product link and check if title matches query
-        seen_hrefs = set()
-        for link in links[:10]:  # Check up to 10 results
-            href = await link.get_attribute("href")
-            if not href or href in seen_hrefs:
-                continue
-            seen_hrefs.add(href)
+        # Pick the product before leaving the search page, since navigating replaces it
+        href = self._pick_result_href(hrefs, query)
+        return await self._extract_from_product_page(page, href, query)
 
+    @staticmethod
+    def _pick_result_href(hrefs: list[str], query: str) -> str:
+        """Pick the first product link whose URL slug matches the query.
+
+        Falls back to the first link even if its title doesn't match well.
+        """
+        for href in hrefs:
             # Extract title from URL slug (format: /bookshop/product/Title-Slug/ISBN)
-            parts = href.split("/")
+            parts = href.rsplit("/", 2)
             if len(parts) >= 2:
                 slug = parts[-2] if parts[-1].isdigit() else parts[-1]
                 # Convert slug to readable title
@@ -115,86 +171,58 @@ class BlackwellsScraper(BaseScraper):
 
                 # Check if this result matches the query
                 if title_matches_query(url_title, query):
-                    result = await self._extract_from_product_page(page, href, query)
-                    if result:
-                        return result
-
-        # Fallback: return first result even if title doesn't match well
-        if seen_hrefs:
-            first_href = list(seen_hrefs)[0]
-            return await self._extract_from_product_page(page, first_href, query)
+                    return href
 
-        return None
+        return hrefs[0]
 
     async def _extract_from_product_page(self, page, href: str, query: str = "") -> BookResult | None:
         """Navigate to a product page and extract details."""
 
-        url = href if href.startswith("http") else f"{self.base_url}{href}"
+        url = self._absolute_url(href)
 
         await page.goto(url, wait_until="domcontentloaded")
 
         # Handle cookie consent if present
-        try:
-            accept_btn = await page.query_selector('button:has-text("Accept All")')
-            if accept_btn:
-                await accept_btn.click()
-        except Exception:
-            pass
+        await self._accept_cookies(page)
 
         # Wait for content to load
         await page.wait_for_load_state("domcontentloaded")
 
-        # Extract title
-        title_el = await page.query_selector("h1")
-        title = await title_el.inner_text() if title_el else "Unknown"
-
-        # Extract price - use CSS selectors for the current/sale price
-        price = "N/A"
-
-        # Try to find the main product price using specific CSS classes
-        # Order matters: most specific first to avoid grabbing "Save XX€" discount amounts
-        price_selectors = [
-            ".product-price--current",   # Current/sale price (most specific)
-            ".product__price",           # Main product price container
-            ".product-price",            # Generic price container
-        ]
-
-        for selector in price_selectors:
-            price_el = await page.query_selector(selector)
-            if price_el:
-                price_text = await price_el.inner_text()
-
-                # Skip if this is a "Save" discount amount
-                if price_text.strip().lower().startswith("save"):
-                    continue
-
-                # Extract price pattern from the text
-                price_match = re.search(r"(\d+[.,]\d{2}€)", price_text)
-                if price_match:
-                    price = price_match.group(1)
-                    break
-
-        # Fallback: look for price near the title/add to basket area
-        if price == "N/A":
-            all_text = await page.inner_text("body")
-            lines = all_text.split("\n")
-
-            for i, line in enumerate(lines):
-                # Look for "Add to basket" and get the price above it
-                if "Add to basket" in line:
-                    # Check previous lines for a price
-                    for j in range(1, 5):
-                        if i - j >= 0:
-                            prev_line = lines[i - j].strip()
-                            price_match = re.match(r"^(\d+[.,]\d{2}€)$", prev_line)
-                            if price_match:
-                                price = price_match.group(1)
-                                break
-                    if price != "N/A":
-                        break
+        # Extract title and price in a single round-trip
+        details = await page.evaluate("""(selectors) => {
+            const h1 = document.querySelector('h1');
+            const title = h1 ? h1.innerText : 'Unknown';
+
+            // Try to find the main product price using specific CSS classes
+            for (const selector of selectors) {
+                const el = document.querySelector(selector);
+                if (!el) continue;
+                const text = el.innerText;
+                // Skip if this is a "Save" discount amount
+                if (text.trim().toLowerCase().startsWith('save')) continue;
+                const match = text.match(/\\d+[.,]\\d{2}€/);
+                if (match) return {title, price: match[0]};
+            }
+
+            // Fallback: look for price near the title/add to basket area
+            const lines = document.body.innerText.split('\\n');
+            for (let i = 0; i < lines.length; i++) {
+                // Look for "Add to basket" and get the price above it
+                if (!lines[i].includes('Add to basket')) continue;
+                // Check previous lines for a price
+                for (let j = 1; j < 5 && i - j >= 0; j++) {
+                    const match = lines[i - j].trim().match(/^(\\d+[.,]\\d{2}€)$/);
+                    if (match) return {title, price: match[1]};
+                }
+            }
+
+            return {title, price: 'N/A'};
+        }""", PRICE_SELECTORS)
+        title = details["title"]
+        price = details["price"]
 
         # Extract ISBN from URL
-        isbn = href.split("/")[-1] if "/" in href else None
+        isbn = href.rpartition("/")[2] if "/" in href else None
 
         return BookResult(
             store=self.name,
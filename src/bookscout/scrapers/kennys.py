@@ -9,6 +9,9 @@ from bookscout.models import BookResult
 
 from .base import BaseScraper, SearchResultItem, title_matches_query
 
+# Trailing "-ISBN" (optionally "-ISBN-1") in product URL slugs
+_SLUG_ISBN_RE = re.compile(r"-(\d{10,13})(?:-\d)?$")
+
 
 class KennysScraper(BaseScraper):
     """Scraper for kennys.ie."""
@@ -27,10 +30,7 @@ class KennysScraper(BaseScraper):
             await page.evaluate(f'window.location.hash = "ges:searchword={query}"')
 
             # Wait for results to render
-            try:
-                await page.wait_for_selector('.result-title', timeout=5000)
-            except Exception:
-                await page.wait_for_timeout(2000)
+            await self._wait_for_results(page)
 
             return await self._extract_first_result(page, query)
         finally:
@@ -46,46 +46,56 @@ class KennysScraper(BaseScraper):
         try:
             await page.goto(f"{self.base_url}/elasticsearch", wait_until="domcontentloaded")
             await page.evaluate(f'window.location.hash = "ges:searchword={query}"')
-            try:
-                await page.wait_for_selector('.result-title', timeout=5000)
-            except Exception:
-                await page.wait_for_timeout(2000)
+            await self._wait_for_results(page)
 
-            # Extract product links with ISBNs from URLs
-            # Kennys URL format: /shop/book-title-author-ISBN or /category/book-title-ISBN
-            product_data = await page.evaluate("""() => {
-                const results = [];
-                const seen = new Set();
+            # Only the hrefs cross the CDP bridge; ISBNs and titles are parsed below
+            hrefs = await page.evaluate("""() => Array.from(
+                document.querySelectorAll('.result-title a[href], .search-result a[href]'),
+                a => a.href,
+            ).filter(href => href && href.includes('kennys.ie'))""")
 
-                // Look for links in search result titles
-                const resultLinks = document.querySelectorAll('.result-title a[href], .search-result a[href]');
-                for (const a of resultLinks) {
-                    const href = a.href;
-                    if (!href || !href.includes('kennys.ie')) continue;
-
-                    // Extract ISBN from URL (pattern: -XXXXXXXXXXXX at end or -XXXXXXXXXXXX-1)
-                    const isbnMatch = href.match(/-(\\d{10,13})([-]\\d)?$/);
-                    if (isbnMatch && !seen.has(isbnMatch[1])) {
-                        seen.add(isbnMatch[1]);
-                        // Extract title from URL slug
-                        const parts = href.split('/');
-                        const slug = parts[parts.length - 1];
-                        const title = slug.replace(/-\\d{10,13}(-\\d)?$/, '').replace(/-/g, ' ');
-                        results.push({
-                            isbn: isbnMatch[1],
-                            url: href,
-                            title: title
-                        });
-                        if (results.length >= 10) break;
-                    }
-                }
-                return results;
-            }""")
-
-            return [SearchResultItem(isbn=item['isbn'], url=item['url'], title=item.get('title')) for item in product_data]
+            # Extract ISBNs from URLs
+            # Kennys URL format: /shop/book-title-author-ISBN or /category/book-title-ISBN
+            results = []
+            seen_isbns = set()
+            for href in hrefs:
+                slug = href.rsplit("/", 1)[-1]
+                isbn_match = _SLUG_ISBN_RE.search(slug)
+                if not isbn_match or isbn_match.group(1) in seen_isbns:
+                    continue
+                seen_isbns.add(isbn_match.group(1))
+                # Title from the URL slug, minus the ISBN
+                title = slug[: isbn_match.start()].replace("-", " ")
+                results.append(SearchResultItem(isbn=isbn_match.group(1), url=href, title=title))
+                if len(results) >= 10:
+                    break
+
+            return results
         finally:
             await page.close()
 
+    async def _wait_for_results(self, page) -> None:
+        """Wait until search results have rendered, or give up after ~7s.
+
+        Returns as soon as result titles appear. Failing that, it waits up to
+        2s more for any product link, which _extract_first_result falls back to.
+        """
+        try:
+            await page.wait_for_selector('.result-title', timeout=5000)
+            return
+        except Exception:
+            pass
+
+        try:
+            await page.wait_for_function(
+                """() => Array.from(document.querySelectorAll('a[href]')).some(
+                    a => /kennys\\.ie\\/[^\\/]+\\/[^\\/?#]+-\\d{10,13}(-\\d)?$/.test(a.href)
+                )""",
+                timeout=2000,
+            )
+        except Exception:
+            pass
+
     async def get_product_details(self, url: str) -> BookResult | None:
         """Fetch full product details from a product page URL."""
         page = await self._new_page()
@@ -138,11 +148,10 @@ class KennysScraper(BaseScraper):
         # Try each product and find one that matches the query
         for href in product_hrefs:
             # Extract title from URL slug
-            parts = href.rstrip("/").split("/")
-            if len(parts) >= 2:
-                slug = parts[-1]
+            _, sep, slug = href.rstrip("/").rpartition("/")
+            if sep:
                 # Remove ISBN from end if present
-                slug = re.sub(r"-\d{10,13}(-\d)?$", "", slug)
+                slug = _SLUG_ISBN_RE.sub("", slug)
                 url_title = slug.replace("-", " ")
 
                 if title_matches_query(url_title, query):
@@ -155,18 +164,36 @@ class KennysScraper(BaseScraper):
 
     async def _extract_from_product_page(self, page, href: str) -> BookResult | None:
         """Navigate to a product page and extract details."""
-        url = href if href.startswith("http") else f"{self.base_url}{href}"
+        url = self._absolute_url(href)
 
         await page.goto(url, wait_until="domcontentloaded")
-        await page.wait_for_load_state("networkidle")
 
-        # Extract title - try h1 first, then page title
-        title_el = await page.query_selector("h1")
-        title = await title_el.inner_text() if title_el else ""
+        # Wait for the product heading rather than network idle, which trackers can delay by seconds
+        try:
+            await page.wait_for_selector("h1", timeout=5000)
+        except PlaywrightTimeout:
+            pass  # Fall back to the page title below
+
+        # Extract title, price candidates and ISBN in a single round-trip
+        page_data = await page.evaluate("""() => {
+            const text = document.body.innerText;
+            const h1 = document.querySelector('h1');
+            const isbnMatch = text.match(/ISBN[:\\s]*(\\d{10,13})/i);
+            return {
+                title: h1 ? h1.innerText : '',
+                pageTitle: document.title,
+                // Find prices in format € XX.XX; at most two integer digits skips
+                // filter labels like "€100 - €200"
+                prices: text.match(/€\\s*\\d{1,2}[.,]\\d{2}/g) || [],
+                isbn: isbnMatch ? isbnMatch[1] : null,
+            };
+        }""")
 
+        # Title - h1 first, then page title
+        title = page_data["title"]
         if not title.strip():
             # Use page title and extract book name (before " - ")
-            page_title = await page.title()
+            page_title = page_data["pageTitle"]
             if " - " in page_title:
                 title = page_title.split(" - ")[0].strip()
             else:
@@ -176,26 +203,17 @@ class KennysScraper(BaseScraper):
         # Kennys shows € XX.XX format
         price = "N/A"
 
-        all_text = await page.inner_text("body")
-
-        # Find prices in format € XX.XX
-        prices = re.findall(r"€\s*\d+[.,]\d{2}", all_text)
+        prices = page_data["prices"]
         if prices:
-            # Filter out very high prices (likely filter labels like "€100 - €200")
-            valid_prices = [p for p in prices if float(p.replace("€", "").replace(",", ".").strip()) < 100]
-            if valid_prices:
-                # The sale price is usually the second one (first is RRP)
-                # But if there's only one, use that
-                if len(valid_prices) >= 2:
-                    price = valid_prices[1]  # Sale price
-                else:
-                    price = valid_prices[0]
-
-        # Extract ISBN from page if available
-        isbn = None
-        isbn_match = re.search(r"ISBN[:\s]*(\d{10,13})", all_text, re.IGNORECASE)
-        if isbn_match:
-            isbn = isbn_match.group(1)
+            # The sale price is usually the second one (first is RRP)
+            # But if there's only one, use that
+            if len(prices) >= 2:
+                price = prices[1]  # Sale price
+            else:
+                price = prices[0]
+
+        # ISBN from page if available
+        isbn = page_data["isbn"]
 
         return BookResult(
             store=self.name,
@@ -7,12 +7,19 @@ from bookscout.models import BookResult
 
 from .base import BaseScraper, SearchResultItem
 
+# Path of a product link in search results, and its trailing "_{id}"
+_PRODUCT_PATH_RE = re.compile(r"/(book|kniha|buch)/[^/]+_\d+$")
+_SLUG_ID_RE = re.compile(r"_\d+$")
+_ISBN_URL_RE = re.compile(r"(\d{13}|\d{10})")
+
 
 class LibristoScraper(BaseScraper):
     """Scraper for libristo.eu."""
 
     name = "Libristo"
     base_url = "https://www.libristo.eu"
+    html_search = True
+    cookie_accept_selector = 'button:has-text("Accept")'
 
     async def search(self, query: str) -> BookResult | None:
         """Search Libristo for a book."""
@@ -24,18 +31,18 @@ class LibristoScraper(BaseScraper):
             await page.goto(search_url, wait_until="domcontentloaded")
 
             # Handle cookie consent if present
-            try:
-                accept_btn = await page.query_selector('button:has-text("Accept")')
-                if accept_btn:
-                    await accept_btn.click()
-            except Exception:
-                pass
+            await self._accept_cookies(page)
 
-            # Wait for search results to load
+            # Wait for a product link to render, rather than sleeping a fixed time
             try:
-                await page.wait_for_selector('a[href*="/book/"]', timeout=5000)
+                await page.wait_for_function(
+                    """() => Array.from(document.querySelectorAll('a[href]')).some(
+                        a => /\\/(book|kniha|buch)\\/[^/]+_\\d+$/.test(a.getAttribute('href'))
+                    )""",
+                    timeout=6500,
+                )
             except Exception:
-                await page.wait_for_timeout(1500)
+                pass
 
             return await self._extract_first_result(page)
         finally:
@@ -48,59 +55,35 @@ class LibristoScraper(BaseScraper):
     async def get_search_results(self, query: str) -> list[SearchResultItem]:
         """Extract URLs from search results without visiting product pages.
 
+        The search results page is server-rendered, so it is fetched over plain
+        HTTP instead of through the browser.
+
         Note: Libristo doesn't have ISBN in URLs, so we return URLs with isbn=None.
         The ISBN will be extracted when visiting the product page.
         """
         encoded_query = urllib.parse.quote_plus(query)
         search_url = f"{self.base_url}/en/search?t={encoded_query}"
 
-        page = await self._new_page()
-        try:
-            await page.goto(search_url, wait_until="domcontentloaded")
-
-            # Handle cookie consent
-            try:
-                accept_btn = await page.query_selector('button:has-text("Accept")')
-                if accept_btn:
-                    await accept_btn.click()
-            except Exception:
-                pass
-
-            try:
-                await page.wait_for_selector('a[href*="/book/"]', timeout=5000)
-            except Exception:
-                await page.wait_for_timeout(1500)
-
-            # Extract product links - pattern /en/book/{slug}_{id}
-            product_data = await page.evaluate('''() => {
-                const results = [];
-                const seen = new Set();
-                const links = document.querySelectorAll('a');
-
-                for (const link of links) {
-                    const href = link.getAttribute('href') || '';
-                    // Match /en/book/ or /sk/kniha/ etc patterns with underscore+digits at end
-                    if (href.match(/\\/(book|kniha|buch)\\/[^/]+_\\d+$/)) {
-                        if (!seen.has(href)) {
-                            seen.add(href);
-                            // Extract title from URL slug
-                            const parts = href.split('/');
-                            const slug = parts[parts.length - 1];
-                            const title = slug.replace(/_\\d+$/, '').replace(/-/g, ' ');
-                            results.push({
-                                url: href,
-                                title: title
-                            });
-                            if (results.length >= 10) break;
-                        }
-                    }
-                }
-                return results;
-            }''')
-
-            return [SearchResultItem(isbn=None, url=f"{self.base_url}{item['url']}" if not item['url'].startswith('http') else item['url'], title=item.get('title')) for item in product_data]
-        finally:
-            await page.close()
+        tree = await self._fetch_html(search_url)
+
+        # Extract product links - pattern /en/book/{slug}_{id}
+        results = []
+        seen = set()
+        for link in tree.css("a[href]"):
+            href = link.attributes.get("href") or ""
+            # Match /en/book/ or /sk/kniha/ etc patterns with underscore+digits at end
+            if not _PRODUCT_PATH_RE.search(href) or href in seen:
+                continue
+            seen.add(href)
+            # Extract title from URL slug
+            slug = href.rpartition("/")[2]
+            title = _SLUG_ID_RE.sub("", slug).replace("-", " ")
+            url = self._absolute_url(href)
+            results.append(SearchResultItem(isbn=None, url=url, title=title))
+            if len(results) >= 10:
+                break
+
+        return results
 
     async def get_product_details(self, url: str) -> BookResult | None:
         """Fetch full product details from a product page URL."""
@@ -132,50 +115,43 @@ class LibristoScraper(BaseScraper):
 
     async def _extract_from_product_page(self, page, href: str) -> BookResult | None:
         """Navigate to a product page and extract details."""
-        url = href if href.startswith("http") else f"{self.base_url}{href}"
+        url = self._absolute_url(href)
 
         await page.goto(url, wait_until="domcontentloaded")
 
         # Handle cookie consent if present
-        try:
-            accept_btn = await page.query_selector('button:has-text("Accept")')
-            if accept_btn:
-                await accept_btn.click()
-        except Exception:
-            pass
+        await self._accept_cookies(page)
 
         await page.wait_for_load_state("domcontentloaded")
 
-        # Extract title from h1
-        title_el = await page.query_selector("h1")
-        title = await title_el.inner_text() if title_el else "Unknown"
-
-        # Extract price - look for € pattern (Libristo uses Euro)
+        # Extract title, price and ISBN in a single round-trip
+        page_data = await page.evaluate("""() => {
+            const h1 = document.querySelector('h1');
+            const text = document.body.innerText;
+            // Libristo uses "EAN" label instead of "ISBN"
+            const labelled = text.match(/(?:ISBN|EAN)[:\\s]*(\\d{10,13})/i);
+            const isbn13 = text.match(/\\b(\\d{13})\\b/);
+            return {
+                title: h1 ? h1.innerText : 'Unknown',
+                // Find prices in format €XX.XX or XX,XX € or XX.XX €
+                price: (text.match(/(?:€\\s*\\d+[.,]\\d{2}|\\d+[.,]\\d{2}\\s*€)/) || [null])[0],
+                isbn: labelled ? labelled[1] : isbn13 ? isbn13[1] : null,
+            };
+        }""")
+        title = page_data["title"]
+
+        # Price - look for € pattern (Libristo uses Euro)
         price = "N/A"
-        all_text = await page.inner_text("body")
-
-        # Find prices in format €XX.XX or XX,XX € or XX.XX €
-        prices = re.findall(r"(?:€\s*\d+[.,]\d{2}|\d+[.,]\d{2}\s*€)", all_text)
-        if prices:
+        if page_data["price"]:
             # Clean up the price format
-            price = prices[0].strip()
-
-        # Try to extract ISBN from the page
-        # Libristo uses "EAN" label instead of "ISBN"
-        isbn = None
-        isbn_match = re.search(r"(?:ISBN|EAN)[:\s]*(\d{10,13})", all_text, re.IGNORECASE)
-        if isbn_match:
-            isbn = isbn_match.group(1)
-        else:
-            # Try to find standalone 13-digit ISBN
-            isbn_13 = re.search(r"\b(\d{13})\b", all_text)
-            if isbn_13:
-                isbn = isbn_13.group(1)
-            else:
-                # Try to find ISBN in URL
-                url_isbn = re.search(r"(\d{13}|\d{10})", href)
-                if url_isbn:
-                    isbn = url_isbn.group(1)
+            price = page_data["price"].strip()
+
+        # ISBN from the page (EAN label, else a standalone 13-digit number), else from the URL
+        isbn = page_data["isbn"]
+        if isbn is None:
+            url_isbn = _ISBN_URL_RE.search(href)
+            if url_isbn:
+                isbn = url_isbn.group(1)
 
         return BookResult(
             store=self.name,
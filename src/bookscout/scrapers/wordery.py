@@ -1,10 +1,7 @@
 """Wordery.com scraper."""
 
-import re
 import urllib.parse
 
-from playwright.async_api import TimeoutError as PlaywrightTimeout
-
 from bookscout.models import BookResult
 
 from .base import BaseScraper, SearchResultItem
@@ -15,6 +12,7 @@ class WorderyScraper(BaseScraper):
 
     name = "Wordery"
     base_url = "https://wordery.com"
+    cookie_accept_selector = 'button:has-text("Accept All")'
 
     async def search(self, query: str) -> BookResult | None:
         """Search Wordery for a book."""
@@ -26,12 +24,7 @@ class WorderyScraper(BaseScraper):
             await page.goto(search_url, wait_until="domcontentloaded")
 
             # Handle cookie consent if present
-            try:
-                accept_btn = await page.query_selector('button:has-text("Accept All")')
-                if accept_btn:
-                    await accept_btn.click()
-            except Exception:
-                pass
+            await self._accept_cookies(page)
 
             # Wait for search results to load (Wordery uses JS to populate hrefs)
             try:
@@ -60,12 +53,7 @@ class WorderyScraper(BaseScraper):
             await page.goto(search_url, wait_until="domcontentloaded")
 
             # Handle cookie consent
-            try:
-                accept_btn = await page.query_selector('button:has-text("Accept All")')
-                if accept_btn:
-                    await accept_btn.click()
-            except Exception:
-                pass
+            await self._accept_cookies(page)
 
             # Wait for search results (Wordery uses JS to populate hrefs)
             try:
@@ -143,40 +131,32 @@ class WorderyScraper(BaseScraper):
 
     async def _extract_from_product_page(self, page, href: str) -> BookResult | None:
         """Navigate to a product page and extract details."""
-        url = href if href.startswith("http") else f"{self.base_url}{href}"
+        url = self._absolute_url(href)
 
         await page.goto(url, wait_until="domcontentloaded")
 
         # Handle cookie consent if present
-        try:
-            accept_btn = await page.query_selector('button:has-text("Accept All")')
-            if accept_btn:
-                await accept_btn.click()
-        except Exception:
-            pass
+        await self._accept_cookies(page)
 
         await page.wait_for_load_state("domcontentloaded")
 
-        # Extract title from h1
-        title_el = await page.query_selector("h1")
-        title = await title_el.inner_text() if title_el else "Unknown"
-
-        # Extract price - look for £ pattern
-        price = "N/A"
-        all_text = await page.inner_text("body")
-
-        # Find prices in format £XX.XX
-        prices = re.findall(r"£\d+[.,]\d{2}", all_text)
-        if prices:
-            price = prices[0]  # First price is usually the main one
+        # Extract title and price in a single round-trip
+        page_data = await page.evaluate("""() => {
+            const h1 = document.querySelector('h1');
+            return {
+                title: h1 ? h1.innerText : 'Unknown',
+                // Find prices in format £XX.XX; the first is usually the main one
+                price: (document.body.innerText.match(/£\\d+[.,]\\d{2}/) || [null])[0],
+            };
+        }""")
+        title = page_data["title"]
+        price = page_data["price"] or "N/A"
 
         # Extract ISBN from URL - pattern is /book/{title}/{author}/{isbn}
-        parts = href.rstrip("/").split("/")
+        last_part = href.rstrip("/").rpartition("/")[2]
         isbn = None
-        if parts:
-            last_part = parts[-1]
-            if len(last_part) >= 10 and last_part.replace("X", "").replace("x", "").isdigit():
-                isbn = last_part
+        if len(last_part) >= 10 and last_part.replace("X", "").replace("x", "").isdigit():
+            isbn = last_part
 
         return BookResult(
             store=self.name,
@@ -1,8 +1,12 @@
 """Pytest configuration and fixtures."""
 
+import asyncio
+
 import pytest
 
+from bookscout import cli
 from bookscout.models import BookResult
+from bookscout.scrapers.base import SearchResultItem
 
 
 @pytest.fixture
@@ -51,3 +55,79 @@ def book_without_isbn():
         url="https://example.com/book/no-isbn",
         isbn=None,
     )
+
+
+ISBN = "9781847941831"
+
+
+class FakeScraper:
+    """Scraper stand-in that records every lookup it is asked to make."""
+
+    name = "Fake"
+    base_url = "https://fake.example"
+    html_search = True
+    search_items: list[SearchResultItem] = []
+    instances: list["FakeScraper"] = []
+    # Pages open at once across all fakes, and the most seen so far
+    open_pages = 0
+    peak_open_pages = 0
+
+    def __init__(self, client=None):
+        self.browser = None
+        self.context = None
+        self.calls: list[tuple[str, str]] = []
+        FakeScraper.instances.append(self)
+
+    async def get_search_results(self, query):
+        self.calls.append(("get_search_results", query))
+        return self.search_items
+
+    async def _load_page(self):
+        """Stand in for a page load, tracking how many are open at once."""
+        FakeScraper.open_pages += 1
+        FakeScraper.peak_open_pages = max(FakeScraper.peak_open_pages, FakeScraper.open_pages)
+        await asyncio.sleep(0)  # Let concurrent lookups overlap
+        FakeScraper.open_pages -= 1
+
+    async def get_product_details(self, url):
+        self.calls.append(("get_product_details", url))
+        await self._load_page()
+        return BookResult(store=self.name, title="Atomic Habits", price="€10.00", url=url, isbn=ISBN)
+
+    async def search_isbn(self, isbn):
+        self.calls.append(("search_isbn", isbn))
+        await self._load_page()
+        return BookResult(store=self.name, title="Atomic Habits", price="€10.00", url=self.base_url, isbn=isbn)
+
+    async def aclose(self):
+        pass
+
+
+@pytest.fixture
+def fake_scrapers(monkeypatch):
+    """Replace the Blackwells and Kennys scrapers with fakes.
+
+    The fake Blackwells lists the book with its price, like a server-rendered
+    results page; the fake Kennys needs a browser and lists only the link.
+    Returns the list of fake scrapers created so far.
+    """
+    FakeScraper.instances.clear()
+    FakeScraper.open_pages = FakeScraper.peak_open_pages = 0
+
+    class FakeHtmlStore(FakeScraper):
+        name = "Blackwells"
+        search_items = [SearchResultItem(isbn=ISBN, url="https://bw.example/p", title="Atomic Habits", price="€9.00")]
+
+    class FakeBrowserStore(FakeScraper):
+        name = "Kennys"
+        html_search = False
+        search_items = [SearchResultItem(isbn=ISBN, url="https://kennys.example/p", title="atomic habits")]
+
+    monkeypatch.setitem(cli.SCRAPER_MAP, cli.Store.blackwells, FakeHtmlStore)
+    monkeypatch.setitem(cli.SCRAPER_MAP, cli.Store.kennys, FakeBrowserStore)
+
+    async def new_browser_context(browser):
+        return object()
+
+    monkeypatch.setattr(cli, "new_browser_context", new_browser_context)
+    return FakeScraper.instances
@@ -0,0 +1,214 @@
+"""Tests for the batch command."""
+
+import asyncio
+import csv
+import io
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from bookscout import cli
+from bookscout.models import BookResult
+
+from .conftest import ISBN, FakeScraper
+
+runner = CliRunner()
+
+
+def fake_run_scrapers_many(book):
+    """Build a run_scrapers_many replacement that finds `book` in the first store only."""
+
+    async def run_scrapers_many(queries, stores, isbn_mode=False, max_concurrency=5, use_cache=True):
+        return [[book] + [None] * (len(stores) - 1) for _ in queries]
+
+    return run_scrapers_many
+
+
+class TestBatch:
+    """Tests for the batch command output."""
+
+    def test_csv_has_query_column(self, tmp_path, monkeypatch, kleppmann_book):
+        """Should prefix every CSV row with the query it belongs to."""
+        queries = tmp_path / "queries.txt"
+        queries.write_text("Designing Data-Intensive Applications\n\nAtomic Habits\n")
+        monkeypatch.setattr(cli, "run_scrapers_many", fake_run_scrapers_many(kleppmann_book))
+
+        result = runner.invoke(cli.app, ["batch", str(queries), "-f", "csv", "-s", "blackwells", "-s", "kennys"])
+
+        assert result.exit_code == 0
+        rows = list(csv.reader(io.StringIO(result.stdout)))
+        assert rows[0] == ["query", "store", "title", "price", "url", "isbn"]
+        assert [row[0] for row in rows[1:]] == [
+            "Designing Data-Intensive Applications",
+            "Designing Data-Intensive Applications",
+            "Atomic Habits",
+            "Atomic Habits",
+        ]
+        assert rows[2][1:] == ["Kennys", "", "Not found", "", ""]
+
+    def test_json_groups_by_query(self, tmp_path, monkeypatch, kleppmann_book):
+        """Should output one object per query with its results."""
+        queries = tmp_path / "queries.txt"
+        queries.write_text("Atomic Habits\n")
+        monkeypatch.setattr(cli, "run_scrapers_many", fake_run_scrapers_many(kleppmann_book))
+
+        result = runner.invoke(cli.app, ["batch", str(queries), "-f", "json", "-s", "blackwells"])
+
+        assert result.exit_code == 0
+        output = json.loads(result.stdout)
+        assert output[0]["query"] == "Atomic Habits"
+        assert output[0]["results"][0]["isbn"] == "9781449373320"
+
+    def test_empty_file(self, tmp_path):
+        """Should fail when the file has no queries."""
+        queries = tmp_path / "queries.txt"
+        queries.write_text("\n  \n")
+
+        result = runner.invoke(cli.app, ["batch", str(queries)])
+
+        assert result.exit_code == 1
+
+
+@pytest.fixture
+def fake_browser(monkeypatch):
+    """Make run_scrapers_many "launch" a browser that does nothing.
+
+    Returns the list of browsers launched so far.
+    """
+    launched = []
+
+    class FakeBrowser:
+        async def close(self):
+            pass
+
+    async def get_playwright():
+        return None
+
+    async def launch_browser(p):
+        await asyncio.sleep(0)  # Give concurrent queries a chance to race
+        launched.append(FakeBrowser())
+        return launched[-1]
+
+    monkeypatch.setattr(cli.daemon, "get_playwright", get_playwright)
+    monkeypatch.setattr(cli.daemon, "launch_browser", launch_browser)
+    return launched
+
+
+def done(result):
+    """Wrap a result in a finished future, as details_cache holds them."""
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(result)
+    return future
+
+
+class TestDetailsCache:
+    """Tests for sharing lookups between queries via details_cache."""
+
+    async def test_isbn_search_answered_from_cache(self, kleppmann_book):
+        """Should not touch the browser when every store's ISBN search is cached."""
+        isbn = kleppmann_book.isbn
+        details_cache = {("Blackwells", isbn): done(kleppmann_book), ("Kennys", isbn): done(None)}
+
+        results = await cli.run_scrapers(
+            isbn,
+            [cli.Store.blackwells, cli.Store.kennys],
+            isbn_mode=True,
+            browser=object(),  # Any use of the browser would fail
+            client=object(),
+            details_cache=details_cache,
+        )
+
+        assert results == [kleppmann_book, None]
+
+    async def test_failed_shared_search_retried_with_browser(self, fake_scrapers):
+        """A query waiting on another query's failed search should run its own."""
+        failed = asyncio.get_running_loop().create_future()
+        failed.set_exception(RuntimeError("page crashed"))
+        details_cache = {("Kennys", ISBN): failed}
+
+        results = await cli.run_scrapers(
+            ISBN,
+            [cli.Store.kennys],
+            isbn_mode=True,
+            browser=object(),
+            client=object(),
+            details_cache=details_cache,
+        )
+
+        (kennys,) = fake_scrapers
+        assert kennys.calls == [("search_isbn", ISBN)]
+        assert kennys.browser is not None
+        assert results[0].isbn == ISBN
+
+    async def test_concurrent_queries_fetch_product_page_once(self, fake_scrapers):
+        """Queries in flight together should share one product page load."""
+        details_cache = {}
+
+        all_results = await asyncio.gather(*[
+            cli.run_scrapers(
+                query,
+                [cli.Store.kennys],
+                use_cache=False,
+                browser=object(),
+                client=object(),
+                details_cache=details_cache,
+            )
+            for query in ["Atomic Habits", "atomic habits"]
+        ])
+
+        calls = [call for scraper in fake_scrapers for call in scraper.calls]
+        assert calls.count(("get_product_details", "https://kennys.example/p")) == 1
+        assert all_results[0] == all_results[1]
+
+    async def test_duplicate_isbns_searched_once(self, fake_browser, fake_scrapers):
+        """Duplicate ISBNs in one batch should share a single search per store."""
+        all_results = await cli.run_scrapers_many(["9781449373320"] * 3, [cli.Store.kennys], isbn_mode=True)
+
+        calls = [call for scraper in fake_scrapers for call in scraper.calls]
+        assert calls == [("search_isbn", "9781449373320")]
+        assert all(results[0].isbn == "9781449373320" for results in all_results)
+
+    async def test_mismatched_product_pages_retried_once(self, monkeypatch, fake_browser, fake_scrapers):
+        """Queries whose product page shows another edition should share one ISBN search."""
+
+        async def get_product_details(self, url):
+            self.calls.append(("get_product_details", url))
+            return BookResult(store=self.name, title="Atomic Habits", price="€5.00", url=url, isbn="9798111111111")
+
+        monkeypatch.setattr(FakeScraper, "get_product_details", get_product_details)
+
+        all_results = await cli.run_scrapers_many(["Atomic Habits", "atomic habits"], [cli.Store.kennys], use_cache=False)
+
+        calls = [call for scraper in fake_scrapers for call in scraper.calls]
+        assert calls.count(("search_isbn", ISBN)) == 1
+        assert all(results[0].isbn == ISBN for results in all_results)
+
+
+class TestPageLimits:
+    """Tests for page load limits across a batch."""
+
+    async def test_per_host_limit_spans_batch(self, monkeypatch, fake_browser, fake_scrapers):
+        """Queries in one batch should share the per-host page load limit."""
+        monkeypatch.setattr(cli, "MAX_REQUESTS_PER_HOST", 1)
+
+        isbns = ["9781847941831", "9781449373320", "9780008560133"]
+        await cli.run_scrapers_many(isbns, [cli.Store.kennys], isbn_mode=True)
+
+        assert FakeScraper.peak_open_pages == 1
+
+
+class TestLazyBatchBrowser:
+    """Tests for starting the batch's shared browser only when needed."""
+
+    async def test_html_only_batch_never_launches(self, fake_browser, fake_scrapers):
+        """A batch answered by result cards should not start Chromium."""
+        await cli.run_scrapers_many(["Atomic Habits", "Deep Work"], [cli.Store.blackwells], use_cache=False)
+
+        assert fake_browser == []
+
+    async def test_browser_launched_once(self, fake_browser, fake_scrapers):
+        """Queries that need Chromium at the same time should share one launch."""
+        await cli.run_scrapers_many(["Atomic Habits", "Deep Work", "Dune"], [cli.Store.kennys], use_cache=False)
+
+        assert len(fake_browser) == 1
@@ -0,0 +1,67 @@
+"""Tests for the canonical ISBN query cache."""
+
+import pytest
+
+from bookscout import cache
+
+
+@pytest.fixture
+def cache_file(tmp_path, monkeypatch):
+    """Point the cache database at a temporary location."""
+    path = tmp_path / "isbn-cache.sqlite3"
+    monkeypatch.setattr(cache, "CACHE_FILE", path)
+    return path
+
+
+class TestNormalizeQuery:
+    """Tests for normalize_query function."""
+
+    def test_case_and_punctuation(self):
+        """Should ignore case, punctuation and extra whitespace."""
+        assert cache.normalize_query("Designing  Data-Intensive Applications!") == "designing data intensive applications"
+
+    def test_equivalent_queries(self):
+        """Trivially different spellings should share a key."""
+        assert cache.normalize_query("atomic habits") == cache.normalize_query("  Atomic Habits ")
+
+
+STORES = ["Blackwells", "Kennys"]
+ITEMS = {"Kennys": {"url": "https://www.kennys.ie/shop/atomic-habits-9781847941831", "title": "atomic habits"}}
+
+
+class TestCanonicalMatchCache:
+    """Tests for get_canonical_match / set_canonical_match."""
+
+    def test_miss(self, cache_file):
+        """Should return None for an unknown query."""
+        assert cache.get_canonical_match("Atomic Habits", STORES) is None
+
+    def test_round_trip(self, cache_file):
+        """Should return the ISBN and items stored for an equivalent query."""
+        cache.set_canonical_match("Atomic Habits", STORES, "9781847941831", ITEMS)
+        assert cache.get_canonical_match("atomic habits", STORES) == ("9781847941831", ITEMS)
+
+    def test_store_order_ignored(self, cache_file):
+        """Should find the entry whatever order the stores are given in."""
+        cache.set_canonical_match("Atomic Habits", STORES, "9781847941831", ITEMS)
+        assert cache.get_canonical_match("Atomic Habits", STORES[::-1]) == ("9781847941831", ITEMS)
+
+    def test_keyed_by_store_selection(self, cache_file):
+        """A vote taken over some stores should not answer a search of others."""
+        cache.set_canonical_match("Atomic Habits", ["Blackwells"], "9781847941831", {})
+        assert cache.get_canonical_match("Atomic Habits", STORES) is None
+
+    def test_overwrite(self, cache_file):
+        """Should keep only the latest ISBN for a query."""
+        cache.set_canonical_match("Atomic Habits", STORES, "9798111111111", {})
+        cache.set_canonical_match("Atomic Habits", STORES, "9781847941831", ITEMS)
+        assert cache.get_canonical_match("Atomic Habits", STORES) == ("9781847941831", ITEMS)
+
+    def test_expired_entry(self, cache_file, monkeypatch):
+        """Should ignore entries older than the TTL."""
+        monkeypatch.setattr(cache.time, "time", lambda: 1_000_000)
+        cache.set_canonical_match("Atomic Habits", STORES, "9781847941831", ITEMS)
+
+        monkeypatch.setattr(cache.time, "time", lambda: 1_000_000 + 61)
+        assert cache.get_canonical_match("Atomic Habits", STORES, ttl=60) is None
+        assert cache.get_canonical_match("Atomic Habits", STORES, ttl=120) == ("9781847941831", ITEMS)
@@ -0,0 +1,111 @@
+"""Tests for the command-line interface."""
+
+import asyncio
+import json
+
+from typer.testing import CliRunner
+
+from bookscout import cache, cli
+
+from .conftest import FakeScraper
+
+runner = CliRunner()
+
+
+class TestDefaultSearch:
+    """Tests for running search without naming the command."""
+
+    def record_search(self, monkeypatch, book):
+        """Replace run_scrapers with one that records its query and finds `book`."""
+        calls = []
+
+        async def run_scrapers(query, stores, isbn_mode=False, use_cache=True):
+            calls.append((query, isbn_mode))
+            return [book] + [None] * (len(stores) - 1)
+
+        monkeypatch.setattr(cli, "run_scrapers", run_scrapers)
+        return calls
+
+    def test_bare_title(self, monkeypatch, kleppmann_book):
+        """Should search for a title given without the search command."""
+        calls = self.record_search(monkeypatch, kleppmann_book)
+
+        result = runner.invoke(cli.app, ["Atomic Habits", "-f", "json", "-s", "blackwells"])
+
+        assert result.exit_code == 0
+        assert calls == [("Atomic Habits", False)]
+        assert json.loads(result.stdout)[0]["isbn"] == "9781449373320"
+
+    def test_bare_isbn_option(self, monkeypatch, kleppmann_book):
+        """Should search by ISBN when the first argument is a search option."""
+        calls = self.record_search(monkeypatch, kleppmann_book)
+
+        result = runner.invoke(cli.app, ["--isbn", "9781847941831", "-f", "json"])
+
+        assert result.exit_code == 0
+        assert calls == [("9781847941831", True)]
+
+    def test_explicit_search_command(self, monkeypatch, kleppmann_book):
+        """Should still accept the search command by name."""
+        calls = self.record_search(monkeypatch, kleppmann_book)
+
+        result = runner.invoke(cli.app, ["search", "Atomic Habits", "-f", "json"])
+
+        assert result.exit_code == 0
+        assert calls == [("Atomic Habits", False)]
+
+
+class TestCanonicalMatchCache:
+    """Tests for how run_scrapers uses the on-disk search cache."""
+
+    async def test_hit_skips_browser_search_only(self, tmp_path, monkeypatch, fake_scrapers):
+        """A repeat search should re-search HTML stores and reuse cached product pages."""
+        monkeypatch.setattr(cache, "CACHE_FILE", tmp_path / "cache.sqlite3")
+        stores = [cli.Store.blackwells, cli.Store.kennys]
+
+        await cli.run_scrapers("Atomic Habits", stores, browser=object(), client=object())
+        fake_scrapers.clear()
+        results = await cli.run_scrapers("Atomic Habits", stores, browser=object(), client=object())
+
+        blackwells, kennys = fake_scrapers
+        assert blackwells.calls == [("get_search_results", "Atomic Habits")]
+        assert kennys.calls == [("get_product_details", "https://kennys.example/p")]
+        assert [r.price for r in results] == ["€9.00", "€10.00"]
+
+
+class TestLazyBrowser:
+    """Tests for starting Chromium only when a store needs it."""
+
+    async def test_html_only_search_never_launches(self, monkeypatch, fake_scrapers):
+        """A search answered by result cards should not start a browser."""
+
+        async def get_playwright():
+            raise AssertionError("browser launched")
+
+        monkeypatch.setattr(cli.daemon, "get_playwright", get_playwright)
+
+        results = await cli.run_scrapers("Atomic Habits", [cli.Store.blackwells], use_cache=False, client=object())
+
+        assert results[0].price == "€9.00"
+
+
+class TestPageLimits:
+    """Tests for bounding product page loads across run_scrapers calls."""
+
+    async def test_shared_page_semaphore(self, fake_scrapers):
+        """Concurrent searches given the same page_sem should share its limit."""
+        page_sem = asyncio.Semaphore(1)
+
+        await asyncio.gather(*[
+            cli.run_scrapers(
+                query,
+                [cli.Store.kennys],
+                use_cache=False,
+                browser=object(),
+                client=object(),
+                page_sem=page_sem,
+            )
+            for query in ["Atomic Habits", "atomic habits"]
+        ])
+
+        assert FakeScraper.peak_open_pages == 1
@@ -0,0 +1,78 @@
+"""Tests for the shared Chromium daemon and Playwright driver."""
+
+import asyncio
+import json
+import os
+
+import pytest
+
+from bookscout import daemon
+
+
+@pytest.fixture
+def state_file(tmp_path, monkeypatch):
+    """Point the daemon state file at a temporary location."""
+    path = tmp_path / "cdp.json"
+    monkeypatch.setattr(daemon, "STATE_FILE", path)
+    return path
+
+
+class TestReadState:
+    """Tests for read_state / read_endpoint."""
+
+    def test_no_state_file(self, state_file):
+        """Should return None when no daemon was started."""
+        assert daemon.read_state() is None
+        assert daemon.read_endpoint() is None
+
+    def test_running_daemon(self, state_file):
+        """Should return the endpoint when the recorded process is alive."""
+        state_file.write_text(json.dumps({"pid": os.getpid(), "endpoint": "http://127.0.0.1:9222"}))
+        assert daemon.read_endpoint() == "http://127.0.0.1:9222"
+
+    def test_dead_daemon_removes_state(self, state_file, monkeypatch):
+        """Should drop a stale state file left by a dead process."""
+        state_file.write_text(json.dumps({"pid": 12345, "endpoint": "http://127.0.0.1:9222"}))
+        monkeypatch.setattr(daemon, "_pid_alive", lambda pid: False)
+
+        assert daemon.read_state() is None
+        assert not state_file.exists()
+
+    def test_corrupt_state_file(self, state_file):
+        """Should treat an unreadable state file as no daemon."""
+        state_file.write_text("not json")
+        assert daemon.read_state() is None
+
+
+class TestStopDaemon:
+    """Tests for stop_daemon."""
+
+    def test_stop_when_not_running(self, state_file):
+        """Should report that nothing was stopped."""
+        assert daemon.stop_daemon() is False
+
+
+class TestGetPlaywright:
+    """Tests for the shared Playwright driver."""
+
+    async def test_concurrent_first_calls_start_once(self, monkeypatch):
+        """Callers racing on first use should share one driver."""
+        starts = []
+
+        class FakeDriver:
+            async def stop(self):
+                pass
+
+        class FakeContextManager:
+            async def start(self):
+                starts.append(1)
+                await asyncio.sleep(0)
+                return FakeDriver()
+
+        monkeypatch.setattr(daemon, "async_playwright", FakeContextManager)
+
+        drivers = await asyncio.gather(*[daemon.get_playwright() for _ in range(3)])
+        await daemon.stop_playwright()
+
+        assert len(starts) == 1
+        assert drivers[0] is drivers[1] is drivers[2]
@@ -2,7 +2,12 @@
 
 import pytest
 
-from bookscout.cli import find_canonical_isbn, find_canonical_isbn_from_results, find_canonical_isbn_weighted
+from bookscout.cli import (
+    find_canonical_isbn,
+    find_canonical_isbn_from_results,
+    find_canonical_isbn_weighted,
+    stores_needing_retry,
+)
 from bookscout.scrapers.base import SearchResultItem
 from bookscout.models import BookResult
 
@@ -34,6 +39,11 @@ class TestFindCanonicalIsbn:
         isbns = ["9781449373320", "9781449373320", "9781449373320", "9798279289592"]
         assert find_canonical_isbn(isbns) == "9781449373320"
 
+    def test_tie_keeps_first_seen(self):
+        """A tie without a majority should go to the ISBN seen first."""
+        isbns = ["1111111111111", "2222222222222", "2222222222222", "1111111111111"]
+        assert find_canonical_isbn(isbns) == "1111111111111"
+
 
 class TestFindCanonicalIsbnFromResults:
     """Tests for find_canonical_isbn_from_results function (takes BookResult list)."""
@@ -129,6 +139,11 @@ class TestIsbnValidationIntegration:
         assert "kennys" in retry_stores
         assert "libristo" not in retry_stores
 
+    def test_stores_needing_retry_helper(self, kleppmann_book, wrong_book, book_without_isbn):
+        """stores_needing_retry should flag missing and mismatched results only."""
+        results = [kleppmann_book, wrong_book, book_without_isbn, None]
+        assert stores_needing_retry(results, "9781449373320") == [1, 3]
+
 
 class TestFindCanonicalIsbnWeighted:
     """Tests for weighted ISBN scoring with ranking and 979-8 penalty."""
@@ -188,3 +203,42 @@ class TestFindCanonicalIsbnWeighted:
         ]
         result = find_canonical_isbn_weighted([store1])
         assert result == "AAAAAAAAAAAAA"
+
+    def test_unanimous_top_result(self):
+        """ISBN ranked first by every store should win."""
+        store1 = [
+            SearchResultItem(isbn="9781449373320", url="u1", title="DDIA"),
+            SearchResultItem(isbn="9798279289592", url="u2", title="Knockoff"),
+        ]
+        store2 = [SearchResultItem(isbn="9781449373320", url="u3", title="DDIA")]
+        store3 = [SearchResultItem(isbn=None, url="u4", title="DDIA")]
+        assert find_canonical_isbn_weighted([store1, store2, store3]) == "9781449373320"
+
+    def test_agreeing_top_results_outvoted_by_lower_ranks(self):
+        """Agreement at position 1 shouldn't win if stores without a top ISBN rank another book highly."""
+        # AAAA: 1.0 from store1; BBBB: 0.5 + 0.5 + 0.5 = 1.5
+        store1 = [
+            SearchResultItem(isbn="AAAAAAAAAAAAA", url="u1", title="A"),
+            SearchResultItem(isbn="BBBBBBBBBBBBB", url="u2", title="B"),
+        ]
+        store2 = [
+            SearchResultItem(isbn=None, url="u3", title="?"),
+            SearchResultItem(isbn="BBBBBBBBBBBBB", url="u4", title="B"),
+        ]
+        store3 = [
+            SearchResultItem(isbn=None, url="u5", title="?"),
+            SearchResultItem(isbn="BBBBBBBBBBBBB", url="u6", title="B"),
+        ]
+        assert find_canonical_isbn_weighted([store1, store2, store3]) == "BBBBBBBBBBBBB"
+
+    def test_tie_keeps_first_seen(self):
+        """On equal scores, the ISBN seen first should win."""
+        store1 = [
+            SearchResultItem(isbn="AAAAAAAAAAAAA", url="u1", title="A"),
+            SearchResultItem(isbn="BBBBBBBBBBBBB", url="u2", title="B"),
+        ]
+        store2 = [
+            SearchResultItem(isbn="BBBBBBBBBBBBB", url="u3", title="B"),
+            SearchResultItem(isbn="AAAAAAAAAAAAA", url="u4", title="A"),
+        ]
+        assert find_canonical_isbn_weighted([store1, store2]) == "AAAAAAAAAAAAA"
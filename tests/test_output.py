@@ -0,0 +1,91 @@
+"""Tests for CSV and JSON output formatting."""
+
+import csv
+import io
+import json
+
+import pytest
+
+from bookscout import cli
+from bookscout.cli import Store, display_csv, display_json
+from bookscout.models import BookResult
+
+
+class TestDisplayCsv:
+    """Tests for display_csv function."""
+
+    def test_header_and_rows(self, capsys, kleppmann_book):
+        """Should write a header, one row per result and a placeholder for misses."""
+        display_csv([kleppmann_book, None], [Store.blackwells, Store.kennys])
+
+        rows = list(csv.reader(io.StringIO(capsys.readouterr().out)))
+        assert rows == [
+            ["store", "title", "price", "url", "isbn"],
+            ["TestStore", "Designing Data-Intensive Applications", "€42.00", "https://example.com/book/ddia", "9781449373320"],
+            ["Kennys", "", "Not found", "", ""],
+        ]
+
+    def test_quotes_and_commas_in_title(self, capsys):
+        """Should escape titles containing quotes, commas and rich markup."""
+        result = BookResult(
+            store="Wordery",
+            title='Dune, the "Deluxe" [bold]Edition[/bold]',
+            price="£11.50",
+            url="https://example.com/dune",
+        )
+        display_csv([result], [Store.wordery])
+
+        rows = list(csv.reader(io.StringIO(capsys.readouterr().out)))
+        assert rows[1] == ["Wordery", 'Dune, the "Deluxe" [bold]Edition[/bold]', "£11.50", "https://example.com/dune", ""]
+
+
+class TestDisplayJson:
+    """Tests for display_json function."""
+
+    def test_normalized_price(self, capsys, wrong_book):
+        """Should output parsed amount and currency."""
+        display_json([wrong_book, None], [Store.wordery, Store.kennys])
+
+        output = json.loads(capsys.readouterr().out)
+        assert output[0]["price"] == 11.50
+        assert output[0]["currency"] == "GBP"
+        assert output[1] == {
+            "store": "Kennys",
+            "title": None,
+            "price": None,
+            "currency": None,
+            "url": None,
+            "isbn": None,
+        }
+
+    def test_same_output_with_and_without_orjson(self, capsys, monkeypatch, kleppmann_book, wrong_book):
+        """The stdlib fallback should match orjson's output byte for byte."""
+        pytest.importorskip("orjson")
+        display_json([kleppmann_book, wrong_book, None], [Store.blackwells, Store.wordery, Store.kennys])
+        with_orjson = capsys.readouterr().out
+
+        monkeypatch.setattr(cli, "orjson", None)
+        display_json([kleppmann_book, wrong_book, None], [Store.blackwells, Store.wordery, Store.kennys])
+        assert capsys.readouterr().out == with_orjson
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_non_ascii_escaped(self, capsys, monkeypatch, use_orjson):
+        """Non-ASCII titles and prices should be escaped exactly as json.dumps does."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(cli, "orjson", None)
+        book = BookResult(
+            store="Libristo",
+            title="Príbeh – 📚",
+            price="£9.99",
+            url="https://www.libristo.eu/sk/kniha/pribeh_1",
+            isbn="9788000000000",
+        )
+
+        display_json([book], [Store.libristo])
+
+        output = capsys.readouterr().out
+        assert output.isascii()
+        expected = cli.results_to_dicts([book], [Store.libristo])
+        assert output == json.dumps(expected, indent=2) + "\n"
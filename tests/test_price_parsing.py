@@ -105,6 +105,12 @@ class TestParsePrice:
         assert result.amount == 42.32
         assert result.currency == "EUR"
 
+    def test_symbol_not_next_to_amount(self):
+        """Should detect currency even when the symbol isn't adjacent to the number."""
+        result = parse_price("€ approx. 42")
+        assert result.amount == 42.0
+        assert result.currency == "EUR"
+
     def test_kennys_format(self):
         """Should parse Kennys format '€ XX.XX'."""
         result = parse_price("€ 15.42")
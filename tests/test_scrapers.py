@@ -1,7 +1,9 @@
 """Tests for scraper functionality."""
 
+import httpx
 import pytest
 
+from bookscout.scrapers import BlackwellsScraper, LibristoScraper
 from bookscout.scrapers.base import title_matches_query
 
 
@@ -65,3 +67,142 @@ class TestTitleMatchesQuery:
             "Python 3.12 Guide",
             "Python 3.12"
         ) is True
+
+
+def html_client(body: str) -> httpx.AsyncClient:
+    """Create an HTTP client that answers every request with the given HTML."""
+    return httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, text=body)))
+
+
+class TestHtmlSearchResults:
+    """Tests for search results parsed from server-rendered HTML."""
+
+    async def test_blackwells_extracts_isbns_from_links(self):
+        """Should take ISBN and title from product link URLs, skipping duplicates."""
+        body = """
+            <a href="/bookshop/product/Atomic-Habits-by-James-Clear/9781847941831">Atomic Habits</a>
+            <a href="/bookshop/product/Atomic-Habits-by-James-Clear/9781847941831">cover</a>
+            <a href="/bookshop/product/Atomic-Habits-Journal-by-James-Clear/9780593539989">Journal</a>
+            <a href="/bookshop/basket">Basket</a>
+        """
+        async with html_client(body) as client:
+            results = await BlackwellsScraper(client=client).get_search_results("Atomic Habits")
+
+        assert [item.isbn for item in results] == ["9781847941831", "9780593539989"]
+        assert results[0].url == "https://blackwells.co.uk/bookshop/product/Atomic-Habits-by-James-Clear/9781847941831"
+        assert results[0].title == "Atomic Habits James Clear"
+
+    async def test_blackwells_reads_title_and_price_from_card(self):
+        """Should take title and price from the result card when it shows them."""
+        body = """
+            <ul>
+              <li class="search-result__item">
+                <a href="/bookshop/product/Atomic-Habits-by-James-Clear/9781847941831"><img></a>
+                <a href="/bookshop/product/Atomic-Habits-by-James-Clear/9781847941831">Atomic Habits</a>
+                <div class="product-price"><span class="product-price--current">17,19€</span></div>
+              </li>
+              <li class="search-result__item">
+                <a href="/bookshop/product/Atomic-Habits-Journal-by-James-Clear/9780593539989">Journal</a>
+              </li>
+            </ul>
+        """
+        async with html_client(body) as client:
+            results = await BlackwellsScraper(client=client).get_search_results("Atomic Habits")
+
+        assert results[0].title == "Atomic Habits"
+        assert results[0].price == "17,19€"
+        # The second card has no price; it must not pick up the first card's
+        assert results[1].price is None
+        assert results[1].title == "Atomic Habits Journal James Clear"
+
+    async def test_libristo_extracts_product_links(self):
+        """Should keep only product links, with ISBN left for the product page."""
+        body = """
+            <a href="/en/book/atomic-habits_12345">Atomic Habits</a>
+            <a href="/en/book/atomic-habits_12345">cover</a>
+            <a href="/en/search?t=atomic">Search</a>
+            <a href="https://www.libristo.eu/sk/kniha/atomic-habits-sk_67890">SK</a>
+        """
+        async with html_client(body) as client:
+            results = await LibristoScraper(client=client).get_search_results("Atomic Habits")
+
+        assert [item.url for item in results] == [
+            "https://www.libristo.eu/en/book/atomic-habits_12345",
+            "https://www.libristo.eu/sk/kniha/atomic-habits-sk_67890",
+        ]
+        assert all(item.isbn is None for item in results)
+        assert results[0].title == "atomic habits"
+
+
+class TestPickResultHref:
+    """Tests for BlackwellsScraper._pick_result_href."""
+
+    def test_prefers_matching_slug(self):
+        """Should skip links whose slug doesn't match the query."""
+        hrefs = [
+            "/bookshop/product/Atomic-Habits-Journal-by-James-Clear/9780593539989",
+            "/bookshop/product/Designing-Data-Intensive-Applications-by-Martin-Kleppmann/9781449373320",
+        ]
+        assert BlackwellsScraper._pick_result_href(hrefs, "Designing Data-Intensive Applications") == hrefs[1]
+
+    def test_falls_back_to_first_link(self):
+        """Should return the first link when nothing matches."""
+        hrefs = ["/bookshop/product/Atomic-Habits-by-James-Clear/9781847941831"]
+        assert BlackwellsScraper._pick_result_href(hrefs, "Python Data Science") == hrefs[0]
+
+
+class FakeButton:
+    """Stand-in for a Playwright element handle."""
+
+    async def click(self):
+        pass
+
+
+class FakePage:
+    """Stand-in for a Playwright page that counts selector lookups."""
+
+    def __init__(self, button=None):
+        self.button = button
+        self.lookups = 0
+
+    async def query_selector(self, selector):
+        self.lookups += 1
+        return self.button
+
+
+class TestAcceptCookies:
+    """Tests for BaseScraper._accept_cookies."""
+
+    async def test_skips_lookup_after_click(self):
+        """Should stop looking for the banner once it has been clicked."""
+        scraper = BlackwellsScraper()
+        first, second = FakePage(FakeButton()), FakePage(FakeButton())
+
+        await scraper._accept_cookies(first)
+        await scraper._accept_cookies(second)
+
+        assert first.lookups == 1
+        assert second.lookups == 0
+
+    async def test_keeps_looking_without_banner(self):
+        """Should check later pages if no banner was shown yet."""
+        scraper = BlackwellsScraper()
+        first, second = FakePage(), FakePage(FakeButton())
+
+        await scraper._accept_cookies(first)
+        await scraper._accept_cookies(second)
+
+        assert second.lookups == 1
+
+
+class TestAbsoluteUrl:
+    """Tests for BaseScraper._absolute_url."""
+
+    def test_resolves_links(self):
+        """Should resolve root-relative, absolute and protocol-relative links."""
+        scraper = BlackwellsScraper()
+        assert scraper._absolute_url("/bookshop/product/9781449373320") == (
+            "https://blackwells.co.uk/bookshop/product/9781449373320"
+        )
+        assert scraper._absolute_url("https://example.com/a") == "https://example.com/a"
+        assert scraper._absolute_url("//blackwells.co.uk/a") == "https://blackwells.co.uk/a"